@@ -0,0 +1,64 @@
+"""
+Pure-numeric kernels for coordinate/profile generation.
+
+These functions contain no FreeCAD calls, so Numba can JIT-compile them when
+it is installed (LLVM-vectorized trig, no Python dispatch per iteration).
+Without Numba they run as plain vectorized NumPy, which is still one C-level
+loop instead of N math.cos/math.sin calls.
+"""
+import math
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op decorator when Numba is unavailable."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(fn):
+            return fn
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def tooth_placements(teeth, radius):
+    """Cutter placements for gear tooth gaps.
+
+    Returns (teeth, 3) array of (x, y, angle_degrees), one row per tooth
+    gap, centered between teeth on a circle of the given radius.
+    """
+    angles = (np.arange(teeth) + 0.5) * (2.0 * math.pi / teeth)
+    out = np.empty((teeth, 3))
+    out[:, 0] = radius * np.cos(angles)
+    out[:, 1] = radius * np.sin(angles)
+    out[:, 2] = np.degrees(angles)
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def polar_coords(n, radius, start=0.0, angle_span=2.0 * math.pi):
+    """(x, y) positions evenly spaced on a circle.
+
+    Shared by the bolt-circle, knurl-flat and polar-pattern generators.
+    Returns an (n, 2) float64 array."""
+    angles = start + np.arange(n) * (angle_span / n)
+    out = np.empty((n, 2))
+    out[:, 0] = radius * np.cos(angles)
+    out[:, 1] = radius * np.sin(angles)
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def involute_points(base_radius, start_angle, stop_angle, samples):
+    """Samples the involute of a circle for one gear flank.
+
+    x = r(cos t + t sin t), y = r(sin t - t cos t). Returns (samples, 2)
+    points suitable for Part.BSplineCurve().interpolate().
+    """
+    t = np.linspace(start_angle, stop_angle, samples)
+    out = np.empty((samples, 2))
+    out[:, 0] = base_radius * (np.cos(t) + t * np.sin(t))
+    out[:, 1] = base_radius * (np.sin(t) - t * np.cos(t))
+    return out
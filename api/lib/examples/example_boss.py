@@ -3,7 +3,7 @@ EXAMPLE: Mounting Boss
 Prompt: "Boss 10mm OD, 8mm tall, 4mm screw hole"
 """
 def generate_model(utils, step_path, stl_path):
-    from FreeCAD import Base
+    from freecad_compat import Base
     
     # Create base plate
     body = utils.create_box("Base", 50, 50, 3, center=True)
@@ -23,8 +23,7 @@ def generate_model(utils, step_path, stl_path):
     if base_edges:
         body = utils.apply_fillet(body, 1.5, edge_names=base_edges)
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
 
 
 # For multiple bosses in a pattern, see example_enclosure.py
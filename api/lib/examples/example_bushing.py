@@ -3,7 +3,7 @@ EXAMPLE: Flanged Bushing
 Prompt: "Bushing, 20mm OD, 12mm ID, 25mm long, with 30mm flange (3mm thick)"
 """
 def generate_model(utils, step_path, stl_path):
-    from FreeCAD import Base
+    from freecad_compat import Base
     
     body = utils.create_bushing(
         "Bushing",
@@ -19,5 +19,4 @@ def generate_model(utils, step_path, stl_path):
     if bore_edges:
         body = utils.apply_chamfer(body, 0.5, edge_names=bore_edges)
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
@@ -3,7 +3,7 @@ EXAMPLE: Cone
 Prompt: "Cone with 20mm base radius, 5mm top radius, 30mm tall"
 """
 def generate_model(utils, step_path, stl_path):
-    from FreeCAD import Base
+    from freecad_compat import Base
     
     # Truncated cone (frustum)
     body = utils.create_cone(
@@ -14,13 +14,12 @@ def generate_model(utils, step_path, stl_path):
         position=Base.Vector(0, 0, 0)
     )
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
 
 
 # Cone is useful for transitions and funnels:
 def generate_funnel(utils, step_path, stl_path):
-    from FreeCAD import Base
+    from freecad_compat import Base
     
     # Outer cone
     outer = utils.create_cone("Outer", 40, 10, 50)
@@ -32,5 +31,4 @@ def generate_funnel(utils, step_path, stl_path):
     # Cut to make hollow funnel
     body = utils.cut_objects(outer, inner)
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
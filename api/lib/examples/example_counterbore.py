@@ -3,7 +3,7 @@ EXAMPLE: Counterbore Hole (for socket head cap screws)
 Prompt: "M6 counterbore hole, 20mm deep, 11mm counterbore dia, 6mm deep"
 """
 def generate_model(utils, step_path, stl_path):
-    from FreeCAD import Base
+    from freecad_compat import Base
     
     # Create a block to cut the counterbore into
     body = utils.create_box("Block", 50, 50, 25, center=True)
@@ -19,5 +19,4 @@ def generate_model(utils, step_path, stl_path):
     )
     body = utils.cut_objects(body, cb)
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
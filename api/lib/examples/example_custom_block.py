@@ -6,47 +6,44 @@ Prompt: "Aluminum block 80x50x20mm with:
          - 10mm slot on side for adjustment"
 """
 def generate_model(utils, step_path, stl_path):
-    from FreeCAD import Base
-    
+    from freecad_compat import Base
+    import numpy as np
+
     L, W, H = 80, 50, 20
-    
+
     # 1. Base block
     body = utils.create_box("Block", L, W, H, center=True)
-    
-    # 2. Counterbore holes at corners (15mm from edge = 25mm from center)
-    cb_positions = [
-        (-L/2 + 15, -W/2 + 15),
-        ( L/2 - 15, -W/2 + 15),
-        (-L/2 + 15,  W/2 - 15),
-        ( L/2 - 15,  W/2 - 15),
-    ]
-    
-    for i, (x, y) in enumerate(cb_positions):
-        cb = utils.create_counterbore(
-            f"CB_{i}",
-            hole_dia=5.5,      # M5 clearance
-            hole_depth=H + 1,
-            cb_dia=10,         # Socket head
-            cb_depth=5,
-            position=Base.Vector(x, y, H/2 - 5)
-        )
-        body = utils.cut_objects(body, cb)
-    
+
+    # 2. Counterbore holes at corners (15mm from edge = 25mm from center):
+    # one prototype, batch-copied to the 4 meshgrid positions
+    xs, ys = np.meshgrid([-L/2 + 15, L/2 - 15], [-W/2 + 15, W/2 - 15])
+    cb_positions = np.column_stack([xs.ravel(), ys.ravel(), np.full(4, H/2 - 5)])
+
+    cb = utils.create_counterbore(
+        "CB",
+        hole_dia=5.5,      # M5 clearance
+        hole_depth=H + 1,
+        cb_dia=10,         # Socket head
+        cb_depth=5
+    )
+    cutters = [utils.create_pattern_copies(cb, cb_positions)]
+
     # 3. Central pocket
-    pocket = utils.create_pocket("CenterPocket", 25, 25, 10, corner_radius=3,
-                                 position=Base.Vector(0, 0, H/2 - 10))
-    body = utils.cut_objects(body, pocket)
-    
+    cutters.append(utils.create_pocket("CenterPocket", 25, 25, 10, corner_radius=3,
+                                       position=Base.Vector(0, 0, H/2 - 10)))
+
     # 4. Side slot
     slot = utils.create_slot("AdjustSlot", 20, 6, W + 1,
                             position=Base.Vector(L/2 - 10, 0, H/2 - 3))
-    slot = utils.rotate_object(slot, Base.Vector(1, 0, 0), 90)
-    body = utils.cut_objects(body, slot)
+    cutters.append(utils.rotate_object(slot, Base.Vector(1, 0, 0), 90))
+
+    # Batched subtraction, partitioned into quadrants: each corner
+    # counterbore only touches the boolean for its own quadrant
+    body = utils.cut_objects_partitioned(body, cutters, num_divisions=2)
     
     # 5. Chamfer all top edges
     top_edges = utils.select_edges(body, z_level=H/2)
     if top_edges:
         body = utils.apply_chamfer(body, 1, edge_names=top_edges)
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
@@ -4,8 +4,9 @@ Prompt: "110x80x45mm enclosure, 2.5mm walls, 3mm floor, R6 corners,
          1° draft, 4 bosses (7mm dia, 6mm tall) in 85x55mm pattern"
 """
 def generate_model(utils, step_path, stl_path):
-    from FreeCAD import Base
-    
+    from freecad_compat import Base
+    import numpy as np
+
     # Dimensions
     L, W, H = 110, 80, 45
     wall_t, floor_t = 2.5, 3.0
@@ -24,12 +25,9 @@ def generate_model(utils, step_path, stl_path):
     )
     
     # 2. Boss positions (centered coords from 85x55 pattern)
-    positions = [
-        (-pattern[0]/2, -pattern[1]/2),
-        ( pattern[0]/2, -pattern[1]/2),
-        (-pattern[0]/2,  pattern[1]/2),
-        ( pattern[0]/2,  pattern[1]/2),
-    ]
+    xs, ys = np.meshgrid([-pattern[0]/2, pattern[0]/2],
+                         [-pattern[1]/2, pattern[1]/2])
+    positions = np.column_stack([xs.ravel(), ys.ravel()])
     
     # 3. Add bosses
     body = utils.add_enclosure_bosses(
@@ -40,15 +38,10 @@ def generate_model(utils, step_path, stl_path):
         base_fillet=1.5
     )
     
-    # 4. Internal fillet
-    floor_edges = utils.select_edges(body, z_level=floor_z)
-    if floor_edges:
-        body = utils.apply_fillet(body, 2.0, edge_names=floor_edges)
-    
-    # 5. Rim fillet
-    rim_edges = utils.select_edges(body, z_level=H/2)
-    if rim_edges:
-        body = utils.apply_fillet(body, 0.5, edge_names=rim_edges)
+    # 4. Internal floor + rim fillets in ONE fillet build
+    radius_map = {e: 2.0 for e in utils.select_edges(body, z_level=floor_z)}
+    radius_map.update({e: 0.5 for e in utils.select_edges(body, z_level=H/2)})
+    if radius_map:
+        body = utils.apply_fillet(body, edge_radius_map=radius_map)
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
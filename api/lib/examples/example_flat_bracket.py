@@ -3,7 +3,7 @@ EXAMPLE: Flat Mounting Bracket
 Prompt: "Flat bracket, 100mm long, 20mm wide, 3mm thick, 4 x 6mm holes"
 """
 def generate_model(utils, step_path, stl_path):
-    from FreeCAD import Base
+    from freecad_compat import Base
     
     body = utils.create_flat_bracket(
         "FlatBracket",
@@ -19,5 +19,4 @@ def generate_model(utils, step_path, stl_path):
     if end_edges:
         body = utils.apply_fillet(body, 10, edge_names=end_edges)
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
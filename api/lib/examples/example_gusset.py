@@ -3,7 +3,7 @@ EXAMPLE: Gusset (Triangular Support)
 Prompt: "Gusset 25mm wide, 20mm tall, 4mm thick"
 """
 def generate_model(utils, step_path, stl_path):
-    from FreeCAD import Base
+    from freecad_compat import Base
     
     # Create L-bracket base to add gusset to
     base = utils.create_box("Base", 50, 30, 5)
@@ -21,5 +21,4 @@ def generate_model(utils, step_path, stl_path):
     )
     body = utils.fuse_objects([body, gusset])
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
@@ -3,7 +3,7 @@ EXAMPLE: Control Knob
 Prompt: "Control knob, 30mm diameter, 15mm tall, 6mm bore, knurled grip (12 flats)"
 """
 def generate_model(utils, step_path, stl_path):
-    from FreeCAD import Base
+    from freecad_compat import Base
     
     body = utils.create_knob(
         "Knob",
@@ -23,5 +23,4 @@ def generate_model(utils, step_path, stl_path):
     if top_edges:
         body = utils.apply_fillet(body, 2, edge_names=top_edges)
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
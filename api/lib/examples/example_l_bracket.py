@@ -4,7 +4,7 @@ Prompt: "L-bracket, 50mm vertical leg, 40mm horizontal leg, 25mm wide,
          3mm thick, 5mm holes at leg centers, R3 inside fillet"
 """
 def generate_model(utils, step_path, stl_path):
-    from FreeCAD import Base
+    from freecad_compat import Base
     
     # Use mega-function
     body = utils.create_l_bracket(
@@ -18,5 +18,4 @@ def generate_model(utils, step_path, stl_path):
         fillet_radius=3
     )
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
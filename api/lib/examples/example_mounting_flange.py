@@ -4,7 +4,7 @@ Prompt: "Motor mount flange, 80x60mm, 8mm thick, 40mm center hole,
          4 x M6 bolt holes at corners (30mm from center)"
 """
 def generate_model(utils, step_path, stl_path):
-    from FreeCAD import Base
+    from freecad_compat import Base
     
     # Bolt positions (centered coords)
     bolts = [(-25, -20), (25, -20), (-25, 20), (25, 20)]
@@ -24,5 +24,4 @@ def generate_model(utils, step_path, stl_path):
     if v_edges:
         body = utils.apply_fillet(body, 5, edge_names=v_edges)
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
@@ -4,7 +4,7 @@ Prompt: "4-inch pipe flange, 150mm OD, 102mm bore, 20mm thick,
          6 x 12mm bolt holes on 125mm BCD, raised hub 115mm x 10mm"
 """
 def generate_model(utils, step_path, stl_path):
-    from FreeCAD import Base
+    from freecad_compat import Base
     
     body = utils.create_pipe_flange(
         "PipeFlange",
@@ -23,5 +23,4 @@ def generate_model(utils, step_path, stl_path):
     if top_edges:
         body = utils.apply_chamfer(body, 2, edge_names=top_edges)
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
@@ -3,7 +3,7 @@ EXAMPLE: V-Belt Pulley
 Prompt: "Pulley for A-section V-belt, 80mm OD, 12mm bore, 20mm wide, 2 grooves"
 """
 def generate_model(utils, step_path, stl_path):
-    from FreeCAD import Base
+    from freecad_compat import Base
     
     body = utils.create_pulley(
         "Pulley",
@@ -20,5 +20,4 @@ def generate_model(utils, step_path, stl_path):
                               position=Base.Vector(0, 0, 5))
     body = utils.cut_objects(body, keyway)
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
@@ -3,7 +3,7 @@ EXAMPLE: Structural Rib
 Prompt: "Reinforcement rib, 40mm long, 15mm tall, 3mm thick"
 """
 def generate_model(utils, step_path, stl_path):
-    from FreeCAD import Base
+    from freecad_compat import Base
     
     # Create L-shaped base to reinforce
     base = utils.create_box("Base", 60, 40, 5, center=True)
@@ -27,5 +27,4 @@ def generate_model(utils, step_path, stl_path):
     if rib_edges:
         body = utils.apply_fillet(body, 2, edge_names=rib_edges)
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
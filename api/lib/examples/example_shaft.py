@@ -3,7 +3,7 @@ EXAMPLE: Shaft with Keyway
 Prompt: "20mm diameter shaft, 100mm long, 6mm keyway (3mm deep, 80mm long)"
 """
 def generate_model(utils, step_path, stl_path):
-    from FreeCAD import Base
+    from freecad_compat import Base
     
     body = utils.create_shaft(
         "Shaft",
@@ -20,5 +20,4 @@ def generate_model(utils, step_path, stl_path):
     if end_edges:
         body = utils.apply_chamfer(body, 1, edge_names=end_edges)
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
@@ -4,7 +4,7 @@ Prompt: "Spur gear, module 2, 24 teeth, 10mm thick, 8mm bore,
          hub 20mm dia x 5mm"
 """
 def generate_model(utils, step_path, stl_path):
-    from FreeCAD import Base
+    from freecad_compat import Base
     
     body = utils.create_spur_gear(
         "SpurGear",
@@ -16,8 +16,7 @@ def generate_model(utils, step_path, stl_path):
         hub_height=5
     )
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
 
 
 # NOTE: For production gears, consider:
@@ -3,7 +3,7 @@ EXAMPLE: PCB Standoff
 Prompt: "M3 standoff, 6mm OD, 10mm tall, 3.2mm through hole"
 """
 def generate_model(utils, step_path, stl_path):
-    from FreeCAD import Base
+    from freecad_compat import Base
     
     body = utils.create_standoff(
         "Standoff",
@@ -17,13 +17,12 @@ def generate_model(utils, step_path, stl_path):
     if edges:
         body = utils.apply_chamfer(body, 0.5, edge_names=edges)
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
 
 
 # For multiple standoffs, use pattern:
 def generate_pcb_standoffs(utils, step_path, stl_path):
-    from FreeCAD import Base
+    from freecad_compat import Base
     
     # Single standoff
     standoff = utils.create_standoff("Standoff", 6, 3.2, 10)
@@ -35,5 +34,4 @@ def generate_pcb_standoffs(utils, step_path, stl_path):
         Base.Vector(0, 1, 0), 50, 2   # Y direction
     )
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
@@ -3,7 +3,7 @@ EXAMPLE: Torus (Donut/O-Ring shape)
 Prompt: "Torus with 30mm major radius, 5mm minor radius"
 """
 def generate_model(utils, step_path, stl_path):
-    from FreeCAD import Base
+    from freecad_compat import Base
     
     # Simple torus
     body = utils.create_torus(
@@ -13,13 +13,12 @@ def generate_model(utils, step_path, stl_path):
         position=Base.Vector(0, 0, 0)
     )
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
 
 
 # Torus is also useful for O-ring grooves:
 def generate_oring_groove(utils, step_path, stl_path):
-    from FreeCAD import Base
+    from freecad_compat import Base
     
     # Shaft with O-ring groove
     shaft = utils.create_cylinder("Shaft", 15, 50, center=True)
@@ -29,5 +28,4 @@ def generate_oring_groove(utils, step_path, stl_path):
                                 position=Base.Vector(0, 0, 0))
     shaft = utils.cut_objects(shaft, groove)
     
-    utils.export_step(shaft, step_path)
-    utils.export_stl(shaft, stl_path)
+    utils.export_both(shaft, step_path, stl_path)
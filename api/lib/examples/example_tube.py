@@ -3,7 +3,7 @@ EXAMPLE: Tube/Pipe Section
 Prompt: "Pipe section, 50mm OD, 40mm ID, 100mm long"
 """
 def generate_model(utils, step_path, stl_path):
-    from FreeCAD import Base
+    from freecad_compat import Base
     
     body = utils.create_tube(
         "Pipe",
@@ -17,5 +17,4 @@ def generate_model(utils, step_path, stl_path):
     if end_edges:
         body = utils.apply_chamfer(body, 1, edge_names=end_edges)
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
@@ -4,7 +4,7 @@ Prompt: "U-channel bracket, 60mm wide, 40mm tall legs, 30mm deep,
          4mm thick, 6mm holes, 2 per leg"
 """
 def generate_model(utils, step_path, stl_path):
-    from FreeCAD import Base
+    from freecad_compat import Base
     
     body = utils.create_u_bracket(
         "UBracket",
@@ -17,5 +17,4 @@ def generate_model(utils, step_path, stl_path):
         fillet_radius=2
     )
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
@@ -3,7 +3,7 @@ EXAMPLE: Wedge (Ramp/Inclined block)
 Prompt: "Wedge ramp, 50mm base, 30mm wide, rising from 0 to 20mm"
 """
 def generate_model(utils, step_path, stl_path):
-    from FreeCAD import Base
+    from freecad_compat import Base
     
     # Wedge: defined by min/max coordinates
     # Creates a shape that tapers in X-Z plane
@@ -16,13 +16,12 @@ def generate_model(utils, step_path, stl_path):
         position=Base.Vector(-25, -15, 0)  # Center it
     )
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
 
 
 # Wedge is useful for ramps, doorstops, and angled supports:
 def generate_doorstop(utils, step_path, stl_path):
-    from FreeCAD import Base
+    from freecad_compat import Base
     
     # Simple doorstop wedge
     body = utils.create_wedge(
@@ -33,11 +32,11 @@ def generate_doorstop(utils, step_path, stl_path):
         x2max=80, z2max=0
     )
     
-    # Add grip ridges on top (optional)
-    for i in range(3):
-        ridge = utils.create_box(f"Ridge_{i}", 80, 3, 2,
-                                position=Base.Vector(0, 10 + i*10, 20))
-        body = utils.cut_objects(body, ridge)
+    # Add grip ridges on top: build the 3-ridge comb as one compound and
+    # subtract it in a single boolean instead of one cut per ridge
+    ridges = [utils.create_box(f"Ridge_{i}", 80, 3, 2,
+                               position=Base.Vector(0, 10 + i*10, 20))
+              for i in range(3)]
+    body = utils.cut_objects(body, ridges)
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
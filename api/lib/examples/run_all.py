@@ -0,0 +1,75 @@
+"""
+Regenerate every example model in parallel.
+
+Each example's generate_model is CPU-bound inside OCC and fully
+independent, and FreeCAD keeps its kernel single-threaded per process —
+so the batch is dispatched across a ProcessPoolExecutor instead of run
+serially. Every worker imports FreeCAD fresh (required: OCC holds global
+state that cannot be shared across a fork boundary safely).
+
+Usage:
+    python3 run_all.py [output_dir]
+"""
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+EXAMPLES_DIR = os.path.dirname(os.path.abspath(__file__))
+LIB_DIR = os.path.dirname(EXAMPLES_DIR)
+
+
+def _init_freecad():
+    """Worker initializer: pay the ~500ms FreeCAD import once per worker."""
+    sys.path.insert(0, LIB_DIR)
+    import freecad_compat
+    freecad_compat.FreeCAD  # noqa: B018 - forces the lazy DLL load now
+
+
+def _run_example(args):
+    """Worker: runs one example in a fresh process/FreeCAD instance."""
+    example_path, output_dir = args
+    name = os.path.splitext(os.path.basename(example_path))[0]
+    sys.path.insert(0, LIB_DIR)
+    try:
+        from freecad_utils import PartUtils
+
+        namespace = {}
+        with open(example_path) as f:
+            exec(compile(f.read(), example_path, 'exec'), namespace)
+
+        utils = PartUtils(name)
+        start = time.time()
+        namespace['generate_model'](
+            utils,
+            os.path.join(output_dir, f"{name}.step"),
+            os.path.join(output_dir, f"{name}.stl"),
+        )
+        return name, time.time() - start, None
+    except Exception as e:
+        return name, 0.0, str(e)
+
+
+def main(output_dir="/tmp/t2s_examples"):
+    os.makedirs(output_dir, exist_ok=True)
+    examples = sorted(glob.glob(os.path.join(EXAMPLES_DIR, "example_*.py")))
+
+    start = time.time()
+    with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                             initializer=_init_freecad) as pool:
+        results = list(pool.map(_run_example, [(p, output_dir) for p in examples]))
+
+    failures = 0
+    for name, elapsed, error in results:
+        if error:
+            failures += 1
+            print(f"FAIL {name}: {error}")
+        else:
+            print(f"ok   {name} ({elapsed:.1f}s)")
+    print(f"{len(results) - failures}/{len(results)} examples in {time.time() - start:.1f}s")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*sys.argv[1:]))
@@ -0,0 +1,33 @@
+"""
+Lazy, memoized access to the FreeCAD bindings.
+
+Importing FreeCAD costs ~500ms of shared-library loading and static
+init. Scripts that only validate arguments (or fail prompt parsing)
+should not pay it, and batch workers should pay it exactly once. This
+module defers the real import until the first attribute access (PEP 562)
+and then serves the cached module on every later lookup.
+
+Usage in generated/example scripts:
+    from freecad_compat import Base
+"""
+import importlib
+import importlib.util
+
+_NAMES = ("FreeCAD", "Base", "Part", "Mesh")
+_cache = {}
+
+
+def __getattr__(name):
+    if name not in _NAMES:
+        raise AttributeError(f"module 'freecad_compat' has no attribute '{name}'")
+    if name not in _cache:
+        if importlib.util.find_spec("FreeCAD") is None:
+            raise ImportError(
+                "FreeCAD bindings not found on PYTHONPATH "
+                "(expected /usr/lib/freecad-python3/lib)")
+        freecad = importlib.import_module("FreeCAD")
+        _cache["FreeCAD"] = freecad
+        _cache["Base"] = freecad.Base
+    if name in ("Part", "Mesh"):
+        _cache[name] = importlib.import_module(name)
+    return _cache[name]
@@ -3,27 +3,214 @@ import Part
 import math
 import Mesh
 import os
+import gzip
+import hashlib
+import shutil
 from FreeCAD import Base
 import logging
+import functools
+from contextlib import contextmanager
+
+from _numeric import tooth_placements, polar_coords
 
 logger = logging.getLogger("text-to-cad-utils")
 logger.setLevel(logging.INFO)
 
+# Content-addressed export cache. Every geometry call is recorded into a
+# per-document trace; exports hash that trace and reuse a previously written
+# STEP/STL when an identical build sequence was already exported. A repeat
+# prompt then costs a file copy instead of a full OCC rebuild.
+CACHE_DIR = os.path.expanduser(os.environ.get("T2S_CACHE_DIR", "~/.cache/t2s"))
+
+# Write gzip-compressed STEP (.stpZ) by default. Paths explicitly ending in
+# ".step" always stay plain ASCII for downstream compatibility.
+STEP_COMPRESS = os.environ.get("T2S_STEP_COMPRESS", "0") == "1"
+
+# Opt-in process pool for bulk primitive construction. Off by default:
+# pool spawn plus BRep round-tripping costs ~100ms before the first win,
+# which only pays off for large heterogeneous primitive sets.
+PARALLEL_PRIMITIVES = os.environ.get("T2S_PARALLEL_PRIMITIVES", "0") == "1"
+
+# Cardinal direction vectors, built once. Values are unit length, so
+# consumers skip the per-call normalize (which copies the vector).
+_DIRECTION_MAP = {
+    '+Z': Base.Vector(0, 0, 1), '-Z': Base.Vector(0, 0, -1),
+    '+X': Base.Vector(1, 0, 0), '-X': Base.Vector(-1, 0, 0),
+    '+Y': Base.Vector(0, 1, 0), '-Y': Base.Vector(0, -1, 0)
+}
+
+_SHAPE_BUILDERS = {
+    'box': Part.makeBox,
+    'cylinder': Part.makeCylinder,
+    'sphere': Part.makeSphere,
+    'cone': Part.makeCone,
+    'torus': Part.makeTorus,
+}
+
+# Method prefixes whose calls contribute to the export cache key.
+_TRACED_PREFIXES = (
+    "create_", "add_", "cut_", "fuse_", "intersect_", "apply_",
+    "move_", "rotate_", "mirror_", "copy_", "center_",
+    "extrude_", "revolve_", "loft_", "select_"
+)
+
+
+def _build_shape_brep(spec):
+    """Pool worker: builds one primitive and returns it as a BRep string.
+
+    TopoShape does not pickle, so shapes cross the process boundary as
+    exportBrepToString payloads and are re-imported by the caller."""
+    kind, args = spec[0], spec[1:]
+    return _SHAPE_BUILDERS[kind](*args).exportBrepToString()
+
+
+def _check_export(path, min_size=100):
+    """True if an exported file exists and is plausibly non-trivial.
+
+    One stat() syscall instead of the exists()+getsize() pair."""
+    try:
+        return os.stat(path).st_size >= min_size
+    except OSError:
+        return False
+
+
+_BREP_CACHE = {}
+_BREP_CACHE_MAX = 128
+
+
+def _brep_cached(method):
+    """Caches a builder's finished shape as a BRep string, keyed by its
+    dimensional arguments (everything except the feature name).
+
+    Design exploration re-runs the gear/flange/pulley builders with
+    identical parameter tuples; on a hit the whole O(cutters) boolean
+    pipeline is skipped and the BRep re-imports into a fresh feature.
+    Module-level, so repeat builds across PartUtils instances in one
+    process hit too."""
+    @functools.wraps(method)
+    def wrapper(self, name, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        brep = _BREP_CACHE.get(key)
+        if brep is None:
+            result = method(self, name, *args, **kwargs)
+            if len(_BREP_CACHE) < _BREP_CACHE_MAX:
+                _BREP_CACHE[key] = result.Shape.exportBrepToString()
+            return result
+        shape = Part.Shape()
+        shape.importBrepFromString(brep)
+        feat = self.doc.addObject("Part::Feature", name)
+        feat.Shape = shape
+        self._recompute()
+        return self._validate(feat, f"{method.__name__}({name})")
+    return wrapper
+
+
+def _deferred(method):
+    """Runs a mega-function under deferred_recompute().
+
+    Applied to the compound builders (gear, pulley, flange, brackets,
+    enclosure, patterns) so their dozens of primitive creations share one
+    final document recompute."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.deferred_recompute():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _trace_repr(value):
+    """Stable, hashable representation of a traced call argument."""
+    if hasattr(value, "Shape") and hasattr(value, "Name"):
+        return f"<obj:{value.Name}>"
+    if isinstance(value, Part.Shape):
+        # Raw cutters have no name; summarize geometry so identical builds
+        # trace identically across sessions (repr would leak an address)
+        bb = value.BoundBox
+        return ("<shape>", value.ShapeType, round(value.Volume, 3),
+                tuple(round(c, 3) for c in (bb.XMin, bb.YMin, bb.ZMin,
+                                            bb.XMax, bb.YMax, bb.ZMax)))
+    if isinstance(value, Base.Vector):
+        return (value.x, value.y, value.z)
+    if isinstance(value, (list, tuple)):
+        return tuple(_trace_repr(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _trace_repr(v)) for k, v in value.items()))
+    return repr(value)
+
 
 class PartUtils:
     def __init__(self, doc_name="Model"):
         self.doc = FreeCAD.newDocument(doc_name)
+        self._trace = []
+        self._proto_cache = {}
+        self._mesh_cache = {}
+        self._edge_index_cache = {}
+        self._face_index_cache = {}
+        self._edge_len_cache = {}
+        self._validated = set()  # shape hashCodes proven isValid()
+        self._bbox_cache = {}
+        self._defer = False
+        self._allowed_roots = tuple(os.path.abspath(p) + os.sep
+                                    for p in (os.getcwd(), "/tmp"))
+        self._wrap_traced_methods()
+
+    # ==========================================================================
+    # EXPORT CACHE (call-trace hashing)
+    # ==========================================================================
+
+    def _wrap_traced_methods(self):
+        """Wraps geometry methods so each call is recorded in self._trace."""
+        for attr in dir(type(self)):
+            if not attr.startswith(_TRACED_PREFIXES):
+                continue
+            method = getattr(self, attr)
+            if callable(method):
+                setattr(self, attr, self._traced(attr, method))
+
+    def _traced(self, name, method):
+        def wrapper(*args, **kwargs):
+            self._trace.append((name, _trace_repr(args), _trace_repr(kwargs)))
+            return method(*args, **kwargs)
+        return wrapper
+
+    def _cache_path(self, suffix, extra=()):
+        """Content-addressed cache path for the current call trace."""
+        key = repr((self._trace, extra))
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return os.path.join(CACHE_DIR, f"{digest}{suffix}")
+
+    def _cache_fetch(self, cache_path, file_path):
+        """Copies a cached export into place. Returns True on hit."""
+        try:
+            if os.path.exists(cache_path) and os.path.getsize(cache_path) >= 100:
+                shutil.copyfile(cache_path, file_path)
+                logger.info(f"Export cache hit: {cache_path} -> {file_path}")
+                return True
+        except OSError as e:
+            logger.warning(f"Export cache read failed: {e}")
+        return False
+
+    def _cache_store(self, cache_path, file_path):
+        """Stores a fresh export in the cache. Never fails the export."""
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            shutil.copyfile(file_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Export cache write failed: {e}")
 
     # ==========================================================================
     # VALIDATION & SAFETY
     # ==========================================================================
 
     def _safe_path(self, path):
-        """Prevents path traversal attacks."""
-        base_dir = os.getcwd()
-        tmp_dir = "/tmp"
+        """Prevents path traversal attacks.
+
+        Allowed roots are precomputed in __init__ (no getcwd syscall per
+        export) and matched with a trailing separator so sibling
+        directories like /tmp2 don't pass a bare startswith('/tmp')."""
         full_path = os.path.abspath(path)
-        if not (full_path.startswith(base_dir) or full_path.startswith(tmp_dir)):
+        if not any(full_path == root.rstrip(os.sep) or full_path.startswith(root)
+                   for root in self._allowed_roots):
             raise PermissionError(f"Path {path} outside allowed directories")
         return full_path
 
@@ -31,70 +218,235 @@ class PartUtils:
         """Validates shape - raises on failure instead of silent return."""
         if obj is None:
             raise ValueError(f"{op_name}: returned None")
-        if not hasattr(obj, 'Shape'):
+        shape = getattr(obj, 'Shape', None)  # one descriptor round-trip
+        if shape is None:
             raise ValueError(f"{op_name}: no Shape attribute")
-        if obj.Shape.isNull():
+        if shape.isNull():
             raise ValueError(f"{op_name}: null shape")
         return obj
 
+    def _shape_valid(self, shape):
+        """Memoized Shape.isValid().
+
+        isValid() walks the whole B-rep; retried exports of the same shape
+        (export_both runs STEP and STL off one body) only pay it once."""
+        h = shape.hashCode()
+        if h in self._validated:
+            return True
+        if shape.isValid():
+            self._validated.add(h)
+            return True
+        return False
+
     def _log(self, obj, label):
         """Debug logging with volume/bbox."""
-        if hasattr(obj, 'Shape') and not obj.Shape.isNull():
-            bb = obj.Shape.BoundBox
-            logger.info(f"{label}: V={obj.Shape.Volume:.1f} [{bb.XLength:.1f}x{bb.YLength:.1f}x{bb.ZLength:.1f}]")
+        if not logger.isEnabledFor(logging.INFO):
+            return  # skip the BoundBox/Volume B-rep traversals entirely
+        shape = getattr(obj, 'Shape', None)
+        if shape is not None and not shape.isNull():
+            bb = shape.BoundBox
+            logger.info(f"{label}: V={shape.Volume:.1f} [{bb.XLength:.1f}x{bb.YLength:.1f}x{bb.ZLength:.1f}]")
 
     # ==========================================================================
     # BASIC PRIMITIVES
     # ==========================================================================
 
+    def _recompute(self, force=False):
+        """Document recompute; skipped inside deferred_recompute() unless
+        the caller is about to read a parametric feature's Shape."""
+        if force or not self._defer:
+            self.doc.recompute()
+
+    @contextmanager
+    def deferred_recompute(self):
+        """Batches document recomputes across many primitive creations.
+
+        Each recompute re-evaluates the whole dependency graph, so a
+        40-tooth gear pays O(teeth x document size) in recomputes alone.
+        Inside this context primitives skip their per-call recompute
+        (their shapes are assigned directly, not computed); one recompute
+        runs on exit. Booleans and parametric features still force their
+        own recompute because their result shape does not exist before it."""
+        if self._defer:
+            yield  # nested: the outermost scope owns the final recompute
+            return
+        self._defer = True
+        try:
+            yield
+        finally:
+            self._defer = False
+            self.doc.recompute()
+
+    # Public alias for generated/user scripts: `with utils.batch(): ...`
+    # collapses the per-op recomputes of a whole scripted sequence into one.
+    batch = deferred_recompute
+
+    def _as_shape(self, obj):
+        """Accepts a document feature or a raw TopoShape."""
+        return obj.Shape if hasattr(obj, 'Shape') else obj
+
+    def _raw_box(self, length, width, height, position=None, center=False):
+        """Throwaway box as a raw TopoShape.
+
+        Tool shapes that are immediately fused or cut away never need a
+        parametric feature, a dependency-graph edge or a recompute —
+        position/center follow create_box semantics (position wins)."""
+        if position is not None:
+            pnt = position
+        elif center:
+            pnt = Base.Vector(-length/2, -width/2, -height/2)
+        else:
+            pnt = Base.Vector(0, 0, 0)
+        return Part.makeBox(length, width, height, pnt)
+
+    def _raw_cylinder(self, radius, height, position=None, direction=None, center=False):
+        """Throwaway cylinder as a raw TopoShape (see _raw_box)."""
+        if position is not None:
+            pnt = position
+        elif center:
+            pnt = Base.Vector(0, 0, -height/2)
+        else:
+            pnt = Base.Vector(0, 0, 0)
+        return Part.makeCylinder(radius, height, pnt,
+                                 direction if direction is not None else Base.Vector(0, 0, 1))
+
+    @staticmethod
+    def _rounded_rect_wire(length, width, radius, z=0.0):
+        """Closed planar wire: centered rectangle with rounded corners.
+
+        radius=0 degrades to a plain rectangle. Used by the enclosure fast
+        path to extrude walls directly instead of fillet+shell."""
+        hl, hw = length/2, width/2
+        Vec = Base.Vector
+        if radius <= 0:
+            pts = [Vec(-hl, -hw, z), Vec(hl, -hw, z), Vec(hl, hw, z), Vec(-hl, hw, z)]
+            return Part.Wire([Part.makeLine(pts[i], pts[(i + 1) % 4]) for i in range(4)])
+
+        r = radius
+        d = r * (1 - math.sqrt(2) / 2)  # sagitta offset from the square corner
+        # Counter-clockwise: side, 90-degree corner arc, x4. Arc rows are
+        # (start, midpoint-on-arc, end).
+        sides = (
+            ((-hl + r, -hw), (hl - r, -hw)),
+            ((hl, -hw + r), (hl, hw - r)),
+            ((hl - r, hw), (-hl + r, hw)),
+            ((-hl, hw - r), (-hl, -hw + r)),
+        )
+        arcs = (
+            ((hl - r, -hw), (hl - d, -hw + d), (hl, -hw + r)),
+            ((hl, hw - r), (hl - d, hw - d), (hl - r, hw)),
+            ((-hl + r, hw), (-hl + d, hw - d), (-hl, hw - r)),
+            ((-hl, -hw + r), (-hl + d, -hw + d), (-hl + r, -hw)),
+        )
+        edges = []
+        for (s1, s2), (a1, am, a2) in zip(sides, arcs):
+            edges.append(Part.makeLine(Vec(*s1, z), Vec(*s2, z)))
+            edges.append(Part.Arc(Vec(*a1, z), Vec(*am, z), Vec(*a2, z)).toShape())
+        return Part.Wire(edges)
+
+    def _cached_shape(self, key, builder):
+        """Returns a copy of a dimension-keyed prototype shape.
+
+        Identical primitives (4 counterbore cylinders, patterned standoffs)
+        are built once by OCC; repeats are a cheap shape copy that gets its
+        own Placement."""
+        proto = self._proto_cache.get(key)
+        if proto is None:
+            proto = builder()
+            self._proto_cache[key] = proto
+        return proto.copy()
+
+    def build_shapes_parallel(self, specs):
+        """Builds many independent primitive shapes, optionally in a pool.
+
+        specs: list of ('box'|'cylinder'|'sphere'|'cone'|'torus', *dims)
+        tuples. With T2S_PARALLEL_PRIMITIVES=1 and enough work, shapes are
+        constructed in worker processes (OCC is single-threaded per
+        process) and round-tripped as BRep strings. Identical dims should
+        go through _cached_shape instead — one build plus copies beats any
+        pool for homogeneous sets."""
+        if PARALLEL_PRIMITIVES and len(specs) >= 8:
+            from multiprocessing import Pool
+            with Pool() as pool:
+                brep_strs = pool.map(_build_shape_brep, specs)
+            shapes = []
+            for s in brep_strs:
+                shape = Part.Shape()
+                shape.importBrepFromString(s)
+                shapes.append(shape)
+            return shapes
+        return [_SHAPE_BUILDERS[spec[0]](*spec[1:]) for spec in specs]
+
+    def bbox(self, obj):
+        """Memoized bounding box for a body.
+
+        OCC recomputes BoundBox with a full sub-shape walk on each access;
+        internal callers (export deflection, cut partitioning, edge
+        selection) go through this cache instead. Keyed by (id, hashCode,
+        placement) so a body that was modified or moved re-measures, while
+        booleans returning new features invalidate naturally."""
+        base = obj.Placement.Base
+        key = (id(obj), obj.Shape.hashCode(),
+               (base.x, base.y, base.z), obj.Placement.Rotation.Q)
+        bb = self._bbox_cache.get(key)
+        if bb is None:
+            bb = obj.Shape.BoundBox
+            self._bbox_cache[key] = bb
+        return bb
+
     def create_box(self, name, length, width, height, center=False, position=None):
         """Creates box. Use center=True for symmetric positioning."""
-        obj = self.doc.addObject("Part::Box", name)
-        obj.Length, obj.Width, obj.Height = length, width, height
+        obj = self.doc.addObject("Part::Feature", name)
+        obj.Shape = self._cached_shape(('box', length, width, height),
+                                       lambda: Part.makeBox(length, width, height))
         if center:
             obj.Placement.Base = Base.Vector(-length/2, -width/2, -height/2)
         if position:
             obj.Placement.Base = position
-        self.doc.recompute()
+        self._recompute()
         return self._validate(obj, f"create_box({name})")
 
     def create_cylinder(self, name, radius, height, center=False, position=None, direction=None):
         """Creates cylinder. direction rotates axis from Z."""
-        obj = self.doc.addObject("Part::Cylinder", name)
-        obj.Radius, obj.Height = radius, height
+        obj = self.doc.addObject("Part::Feature", name)
+        obj.Shape = self._cached_shape(('cylinder', radius, height),
+                                       lambda: Part.makeCylinder(radius, height))
         if center:
             obj.Placement.Base = Base.Vector(0, 0, -height/2)
         if position:
             obj.Placement.Base = position
         if direction:
             obj.Placement.Rotation = FreeCAD.Rotation(Base.Vector(0,0,1), direction)
-        self.doc.recompute()
+        self._recompute()
         return self._validate(obj, f"create_cylinder({name})")
 
     def create_sphere(self, name, radius, position=None):
-        obj = self.doc.addObject("Part::Sphere", name)
-        obj.Radius = radius
+        obj = self.doc.addObject("Part::Feature", name)
+        obj.Shape = self._cached_shape(('sphere', radius),
+                                       lambda: Part.makeSphere(radius))
         if position:
             obj.Placement.Base = position
-        self.doc.recompute()
+        self._recompute()
         return self._validate(obj, f"create_sphere({name})")
 
     def create_cone(self, name, radius1, radius2, height, position=None):
         """radius1=bottom, radius2=top."""
-        obj = self.doc.addObject("Part::Cone", name)
-        obj.Radius1, obj.Radius2, obj.Height = radius1, radius2, height
+        obj = self.doc.addObject("Part::Feature", name)
+        obj.Shape = self._cached_shape(('cone', radius1, radius2, height),
+                                       lambda: Part.makeCone(radius1, radius2, height))
         if position:
             obj.Placement.Base = position
-        self.doc.recompute()
+        self._recompute()
         return self._validate(obj, f"create_cone({name})")
 
     def create_torus(self, name, radius1, radius2, position=None):
         """radius1=major (center to tube), radius2=minor (tube radius)."""
-        obj = self.doc.addObject("Part::Torus", name)
-        obj.Radius1, obj.Radius2 = radius1, radius2
+        obj = self.doc.addObject("Part::Feature", name)
+        obj.Shape = self._cached_shape(('torus', radius1, radius2),
+                                       lambda: Part.makeTorus(radius1, radius2))
         if position:
             obj.Placement.Base = position
-        self.doc.recompute()
+        self._recompute()
         return self._validate(obj, f"create_torus({name})")
 
     def create_wedge(self, name, xmin, ymin, zmin, x2min, z2min, xmax, ymax, zmax, x2max, z2max, position=None):
@@ -106,7 +458,7 @@ class PartUtils:
         obj.X2max, obj.Z2max = x2max, z2max
         if position:
             obj.Placement.Base = position
-        self.doc.recompute()
+        self._recompute(force=True)
         return self._validate(obj, f"create_wedge({name})")
 
     # ==========================================================================
@@ -118,68 +470,98 @@ class PartUtils:
         return self.create_cylinder(name, diameter/2, depth, position=position)
 
     def create_counterbore(self, name, hole_dia, hole_depth, cb_dia, cb_depth, position=None):
-        """Counterbore: hole + larger recess for socket head bolts."""
-        hole = self.create_cylinder(f"{name}_hole", hole_dia/2, hole_depth)
-        cb = self.create_cylinder(f"{name}_cb", cb_dia/2, cb_depth,
-                                  position=Base.Vector(0, 0, hole_depth - cb_depth))
-        tool = self.fuse_objects([hole, cb])
+        """Counterbore: hole + larger recess for socket head bolts.
+
+        Dimension-keyed like the primitives: four identical M5 counterbores
+        fuse their two cylinders once and share the prototype BRep."""
+        def build():
+            hole = Part.makeCylinder(hole_dia/2, hole_depth)
+            cb = Part.makeCylinder(cb_dia/2, cb_depth,
+                                   Base.Vector(0, 0, hole_depth - cb_depth))
+            return hole.fuse(cb).removeSplitter()
+
+        tool = self.doc.addObject("Part::Feature", name)
+        tool.Shape = self._cached_shape(
+            ('counterbore', hole_dia, hole_depth, cb_dia, cb_depth), build)
         if position:
             tool.Placement.Base = position
-        self.doc.recompute()
+        self._recompute()
         return self._validate(tool, f"create_counterbore({name})")
 
     def create_countersink(self, name, hole_dia, hole_depth, cs_dia, cs_angle=90, position=None):
-        """Countersink: hole + conical recess for flat head screws."""
-        hole = self.create_cylinder(f"{name}_hole", hole_dia/2, hole_depth)
-        cs_depth = (cs_dia - hole_dia) / 2 / math.tan(math.radians(cs_angle/2))
-        cone = self.create_cone(f"{name}_cs", cs_dia/2, hole_dia/2, cs_depth,
-                               position=Base.Vector(0, 0, hole_depth - cs_depth))
-        tool = self.fuse_objects([hole, cone])
+        """Countersink: hole + conical recess for flat head screws.
+
+        Single-pass raw builder like create_counterbore — no intermediate
+        document features, one fuse, dimension-keyed prototype."""
+        def build():
+            hole = Part.makeCylinder(hole_dia/2, hole_depth)
+            cs_depth = (cs_dia - hole_dia) / 2 / math.tan(math.radians(cs_angle/2))
+            cone = Part.makeCone(cs_dia/2, hole_dia/2, cs_depth,
+                                 Base.Vector(0, 0, hole_depth - cs_depth))
+            return hole.fuse(cone).removeSplitter()
+
+        tool = self.doc.addObject("Part::Feature", name)
+        tool.Shape = self._cached_shape(
+            ('countersink', hole_dia, hole_depth, cs_dia, cs_angle), build)
         if position:
             tool.Placement.Base = position
-        self.doc.recompute()
+        self._recompute()
         return self._validate(tool, f"create_countersink({name})")
 
     def create_slot(self, name, length, width, depth, position=None):
         """Slot: rounded-end channel (like adjustment slots)."""
-        r = width / 2
-        box = self.create_box(f"{name}_box", length - width, width, depth, center=True)
-        c1 = self.create_cylinder(f"{name}_c1", r, depth, center=True,
-                                  position=Base.Vector(-(length-width)/2, 0, 0))
-        c2 = self.create_cylinder(f"{name}_c2", r, depth, center=True,
-                                  position=Base.Vector((length-width)/2, 0, 0))
-        tool = self.fuse_objects([box, c1, c2])
+        def build():
+            r = width / 2
+            half = (length - width) / 2
+            box = Part.makeBox(length - width, width, depth,
+                               Base.Vector(-half, -r, -depth/2))
+            c1 = Part.makeCylinder(r, depth, Base.Vector(-half, 0, -depth/2))
+            c2 = Part.makeCylinder(r, depth, Base.Vector(half, 0, -depth/2))
+            return box.multiFuse([c1, c2]).removeSplitter()
+
+        tool = self.doc.addObject("Part::Feature", name)
+        tool.Shape = self._cached_shape(('slot', length, width, depth), build)
         if position:
             tool.Placement.Base = position
-        self.doc.recompute()
+        self._recompute()
         return self._validate(tool, f"create_slot({name})")
 
     def create_pocket(self, name, length, width, depth, corner_radius=0, position=None):
         """Rectangular pocket with optional corner radius."""
-        if corner_radius > 0:
-            # Create rounded rectangle pocket
-            box = self.create_box(f"{name}_box", length, width, depth, center=True)
-            v_edges = self.select_edges(box, direction='Z')
-            if v_edges:
-                box = self.apply_fillet(box, corner_radius, edge_names=v_edges)
-            if position:
-                box.Placement.Base = position
-            return box
-        else:
+        if corner_radius <= 0:
+            # Fast path: plain box, no edge selection machinery at all
             return self.create_box(name, length, width, depth, center=True, position=position)
 
+        # Rounded rectangle pocket
+        box = self.create_box(f"{name}_box", length, width, depth, center=True)
+        if v_edges := self.select_edges(box, direction='Z'):
+            box = self.apply_fillet(box, corner_radius, edge_names=v_edges)
+        if position:
+            box.Placement.Base = position
+        return box
+
     # ==========================================================================
     # BOSS/STANDOFF FEATURES
     # ==========================================================================
 
     def create_boss(self, name, outer_dia, height, hole_dia=None, position=None):
-        """Mounting boss with optional center hole for screws."""
-        boss = self.create_cylinder(f"{name}_outer", outer_dia/2, height, position=position)
-        if hole_dia and hole_dia > 0:
-            pos = position if position else Base.Vector(0,0,0)
-            hole = self.create_cylinder(f"{name}_hole", hole_dia/2, height * 1.1,
-                                       position=Base.Vector(pos.x, pos.y, pos.z - height*0.05))
-            boss = self.cut_objects(boss, hole)
+        """Mounting boss with optional center hole for screws.
+
+        Built at the origin from a dimension-keyed prototype, then placed —
+        a 4-boss pattern performs the cylinder cut once."""
+        def build():
+            outer = Part.makeCylinder(outer_dia/2, height)
+            if hole_dia and hole_dia > 0:
+                hole = Part.makeCylinder(hole_dia/2, height * 1.1,
+                                         Base.Vector(0, 0, -height*0.05))
+                outer = outer.cut(hole)
+            return outer
+
+        boss = self.doc.addObject("Part::Feature", name)
+        boss.Shape = self._cached_shape(('boss', outer_dia, height, hole_dia), build)
+        if position:
+            boss.Placement.Base = position
+        self._recompute()
         return self._validate(boss, f"create_boss({name})")
 
     def create_standoff(self, name, outer_dia, inner_dia, height, position=None):
@@ -206,6 +588,7 @@ class PartUtils:
     # ENCLOSURE MEGA-FUNCTIONS
     # ==========================================================================
 
+    @_deferred
     def create_enclosure_base(self, name, length, width, height,
                               wall_thickness, floor_thickness=None,
                               corner_radius=0, draft_angle=0, open_face='+Z'):
@@ -218,6 +601,35 @@ class PartUtils:
 
         logger.info(f"create_enclosure_base: {length}x{width}x{height}, wall={wall_thickness}, floor={floor_thickness}")
 
+        # Fast path (no draft, standard +Z opening): extrude the annular
+        # rounded-rect profile into the wall directly and fuse a floor slab
+        # under it. Skips the draft/fillet/shell pipeline entirely —
+        # shelling a filleted box is the most expensive OCCT call in the
+        # old sequence. Other open faces keep the shell path, which knows
+        # how to remove an arbitrary face.
+        if draft_angle == 0 and open_face == '+Z':
+            z0 = -height/2
+            inner_r = max(corner_radius - wall_thickness, 0)
+            outer = self._rounded_rect_wire(length, width, corner_radius,
+                                            z0 + floor_thickness)
+            inner = self._rounded_rect_wire(length - 2*wall_thickness,
+                                            width - 2*wall_thickness,
+                                            inner_r, z0 + floor_thickness)
+            wall = Part.Face([outer, inner]).extrude(
+                Base.Vector(0, 0, height - floor_thickness))
+            floor_wire = self._rounded_rect_wire(length, width, corner_radius, z0)
+            floor = Part.Face([floor_wire]).extrude(
+                Base.Vector(0, 0, floor_thickness))
+
+            body = self.doc.addObject("Part::Feature", name)
+            body.Shape = wall.fuse(floor).removeSplitter()
+            self._recompute()
+            self._validate(body, f"create_enclosure_base({name})")
+
+            internal_floor_z = z0 + floor_thickness
+            logger.info(f"Enclosure complete. Internal floor Z = {internal_floor_z}")
+            return body, internal_floor_z
+
         # 1. Box
         body = self.create_box(f"{name}_box", length, width, height, center=True)
 
@@ -226,10 +638,8 @@ class PartUtils:
             body = self.apply_draft(body, Base.Vector(0,0,1), -abs(draft_angle), neutral_plane_z=-height/2)
 
         # 3. Corner fillets
-        if corner_radius > 0:
-            v_edges = self.select_edges(body, direction='Z')
-            if v_edges:
-                body = self.apply_fillet(body, corner_radius, edge_names=v_edges)
+        if corner_radius > 0 and (v_edges := self.select_edges(body, direction='Z')):
+            body = self.apply_fillet(body, corner_radius, edge_names=v_edges)
 
         # 4. Shell
         body = self.create_shell(body, wall_thickness, open_face_direction=open_face)
@@ -238,6 +648,7 @@ class PartUtils:
         logger.info(f"Enclosure complete. Internal floor Z = {internal_floor_z}")
         return body, internal_floor_z
 
+    @_deferred
     def add_enclosure_bosses(self, body, positions, boss_dia, boss_height,
                             floor_z, hole_dia=None, base_fillet=0):
         """
@@ -246,19 +657,23 @@ class PartUtils:
         """
         logger.info(f"Adding {len(positions)} bosses: dia={boss_dia}, h={boss_height}")
 
+        # One prototype boss feature; per-position copies are raw shape
+        # translations feeding a single n-ary fuse. OCC builds one
+        # face-face intersection graph over body + all bosses at once.
+        Vec = Base.Vector
+        proto = self.create_boss("Boss_proto", boss_dia, boss_height, hole_dia=hole_dia)
+        src = proto.Shape
         bosses = []
-        for i, (x, y) in enumerate(positions):
-            boss = self.create_boss(f"Boss_{i}", boss_dia, boss_height,
-                                   hole_dia=hole_dia,
-                                   position=Base.Vector(x, y, floor_z))
-            bosses.append(boss)
+        for x, y in positions:
+            s = src.copy()
+            s.translate(Vec(x, y, floor_z))
+            bosses.append(s)
+        self._release([proto])
 
         body = self.fuse_objects([body] + bosses)
 
-        if base_fillet > 0:
-            edges = self.select_edges(body, edge_type='Circle', z_level=floor_z)
-            if edges:
-                body = self.apply_fillet(body, base_fillet, edge_names=edges)
+        if base_fillet > 0 and (edges := self.select_edges(body, edge_type='Circle', z_level=floor_z)):
+            body = self.apply_fillet(body, base_fillet, edge_names=edges)
 
         return body
 
@@ -266,6 +681,7 @@ class PartUtils:
     # BRACKET MEGA-FUNCTIONS
     # ==========================================================================
 
+    @_deferred
     def create_l_bracket(self, name, leg1_length, leg2_length, width, thickness,
                         hole_dia=0, hole_positions=None, fillet_radius=0):
         """
@@ -280,28 +696,27 @@ class PartUtils:
 
         body = self.fuse_objects([leg1, leg2])
 
-        # Inside corner fillet
-        if fillet_radius > 0:
-            # Select the inside corner edge
-            inside_edges = self.select_edges(body, direction='Y', z_level=thickness)
-            if inside_edges:
-                body = self.apply_fillet(body, fillet_radius, edge_names=inside_edges)
+        # Inside corner fillet (zero radius never touches the edge walk)
+        if fillet_radius > 0 and (inside_edges := self.select_edges(body, direction='Y', z_level=thickness)):
+            body = self.apply_fillet(body, fillet_radius, edge_names=inside_edges)
 
-        # Holes
+        # Holes: collected and subtracted in one boolean
         if hole_dia > 0 and hole_positions:
+            x_dir = Base.Vector(1, 0, 0)
+            holes = []
             for leg, offset in hole_positions:
                 if leg == 1:  # Vertical leg
-                    pos = Base.Vector(-thickness/2, width/2, offset)
-                    hole = self.create_cylinder(f"{name}_hole", hole_dia/2, thickness*2,
-                                               position=pos, direction=Base.Vector(1,0,0))
+                    holes.append(self._raw_cylinder(hole_dia/2, thickness*2,
+                                                    position=Base.Vector(-thickness/2, width/2, offset),
+                                                    direction=x_dir))
                 else:  # Horizontal leg
-                    pos = Base.Vector(offset, width/2, -thickness/2)
-                    hole = self.create_cylinder(f"{name}_hole", hole_dia/2, thickness*2,
-                                               position=pos)
-                body = self.cut_objects(body, hole)
+                    holes.append(self._raw_cylinder(hole_dia/2, thickness*2,
+                                                    position=Base.Vector(offset, width/2, -thickness/2)))
+            body = self.cut_objects(body, holes)
 
         return self._validate(body, f"create_l_bracket({name})")
 
+    @_deferred
     def create_u_bracket(self, name, width, height, depth, thickness,
                         hole_dia=0, holes_per_leg=0, fillet_radius=0):
         """
@@ -318,27 +733,24 @@ class PartUtils:
 
         body = self.fuse_objects([base, left, right])
 
-        # Fillets on inside corners
-        if fillet_radius > 0:
-            inside_edges = self.select_edges(body, direction='Y', z_level=thickness)
-            if inside_edges:
-                body = self.apply_fillet(body, fillet_radius, edge_names=inside_edges)
+        # Fillets on inside corners (zero radius never touches the edge walk)
+        if fillet_radius > 0 and (inside_edges := self.select_edges(body, direction='Y', z_level=thickness)):
+            body = self.apply_fillet(body, fillet_radius, edge_names=inside_edges)
 
-        # Holes in legs
+        # Holes in legs: both legs' holes subtracted in one boolean
         if hole_dia > 0 and holes_per_leg > 0:
             spacing = height / (holes_per_leg + 1)
+            x_dir = Base.Vector(1, 0, 0)
+            holes = []
             for i in range(holes_per_leg):
                 z = thickness + spacing * (i + 1)
-                # Left leg hole
-                hole_l = self.create_cylinder(f"{name}_hole_l{i}", hole_dia/2, thickness*2,
-                                             position=Base.Vector(-thickness/2, depth/2, z),
-                                             direction=Base.Vector(1,0,0))
-                body = self.cut_objects(body, hole_l)
-                # Right leg hole
-                hole_r = self.create_cylinder(f"{name}_hole_r{i}", hole_dia/2, thickness*2,
-                                             position=Base.Vector(width-thickness/2, depth/2, z),
-                                             direction=Base.Vector(1,0,0))
-                body = self.cut_objects(body, hole_r)
+                holes.append(self._raw_cylinder(hole_dia/2, thickness*2,
+                                                position=Base.Vector(-thickness/2, depth/2, z),
+                                                direction=x_dir))
+                holes.append(self._raw_cylinder(hole_dia/2, thickness*2,
+                                                position=Base.Vector(width-thickness/2, depth/2, z),
+                                                direction=x_dir))
+            body = self.cut_objects(body, holes)
 
         return self._validate(body, f"create_u_bracket({name})")
 
@@ -352,17 +764,17 @@ class PartUtils:
                                      hole_positions=[(1, leg1/2), (2, leg2/2)] if hole_dia > 0 else None,
                                      fillet_radius=fillet_radius)
 
+    @_deferred
     def create_flat_bracket(self, name, length, width, thickness, hole_dia=0, hole_count=2):
         """Simple flat bracket with holes."""
         body = self.create_box(name, length, width, thickness, center=True)
 
         if hole_dia > 0 and hole_count > 0:
             spacing = length / (hole_count + 1)
-            for i in range(hole_count):
-                x = -length/2 + spacing * (i + 1)
-                hole = self.create_cylinder(f"{name}_hole_{i}", hole_dia/2, thickness*2,
-                                           position=Base.Vector(x, 0, -thickness))
-                body = self.cut_objects(body, hole)
+            holes = [self._raw_cylinder(hole_dia/2, thickness*2,
+                                        position=Base.Vector(-length/2 + spacing * (i + 1), 0, -thickness))
+                     for i in range(hole_count)]
+            body = self.cut_objects(body, holes)
 
         return self._validate(body, f"create_flat_bracket({name})")
 
@@ -370,6 +782,8 @@ class PartUtils:
     # FLANGE MEGA-FUNCTIONS
     # ==========================================================================
 
+    @_brep_cached
+    @_deferred
     def create_pipe_flange(self, name, outer_dia, inner_dia, thickness,
                           bolt_circle_dia, bolt_hole_dia, bolt_count,
                           hub_dia=0, hub_height=0):
@@ -388,20 +802,14 @@ class PartUtils:
         else:
             total_height = thickness
 
-        # Center bore
-        bore = self.create_cylinder(f"{name}_bore", inner_dia/2, total_height * 1.1,
-                                   position=Base.Vector(0, 0, -total_height*0.05))
-        flange = self.cut_objects(flange, bore)
-
-        # Bolt holes
-        angle_step = 360 / bolt_count
-        for i in range(bolt_count):
-            angle = math.radians(i * angle_step)
-            x = (bolt_circle_dia/2) * math.cos(angle)
-            y = (bolt_circle_dia/2) * math.sin(angle)
-            hole = self.create_cylinder(f"{name}_bolt_{i}", bolt_hole_dia/2, thickness*1.1,
-                                       position=Base.Vector(x, y, -thickness*0.05))
-            flange = self.cut_objects(flange, hole)
+        # Center bore + bolt holes in one batched subtraction; bolt circle
+        # positions come from one vectorized trig pass, not per-hole math.cos
+        cutters = [self._raw_cylinder(inner_dia/2, total_height * 1.1,
+                                      position=Base.Vector(0, 0, -total_height*0.05))]
+        for x, y in polar_coords(bolt_count, bolt_circle_dia/2).tolist():
+            cutters.append(self._raw_cylinder(bolt_hole_dia/2, thickness*1.1,
+                                              position=Base.Vector(x, y, -thickness*0.05)))
+        flange = self.cut_objects(flange, cutters)
 
         return self._validate(flange, f"create_pipe_flange({name})")
 
@@ -413,17 +821,14 @@ class PartUtils:
         """
         flange = self.create_box(f"{name}_base", length, width, thickness, center=True)
 
-        # Center hole
-        center = self.create_cylinder(f"{name}_center", center_hole_dia/2, thickness*1.1,
-                                     position=Base.Vector(0, 0, -thickness*0.55))
-        flange = self.cut_objects(flange, center)
-
-        # Bolt holes
+        # Center hole + bolt holes in one batched subtraction
+        cutters = [self._raw_cylinder(center_hole_dia/2, thickness*1.1,
+                                      position=Base.Vector(0, 0, -thickness*0.55))]
         if bolt_hole_dia > 0 and bolt_positions:
-            for i, (x, y) in enumerate(bolt_positions):
-                hole = self.create_cylinder(f"{name}_bolt_{i}", bolt_hole_dia/2, thickness*1.1,
-                                           position=Base.Vector(x, y, -thickness*0.55))
-                flange = self.cut_objects(flange, hole)
+            for x, y in bolt_positions:
+                cutters.append(self._raw_cylinder(bolt_hole_dia/2, thickness*1.1,
+                                                  position=Base.Vector(x, y, -thickness*0.55)))
+        flange = self.cut_objects(flange, cutters)
 
         return self._validate(flange, f"create_mounting_flange({name})")
 
@@ -431,6 +836,8 @@ class PartUtils:
     # GEAR FUNCTIONS
     # ==========================================================================
 
+    @_brep_cached
+    @_deferred
     def create_spur_gear(self, name, module, teeth, thickness, bore_dia=0,
                         pressure_angle=20, hub_dia=0, hub_height=0):
         """
@@ -446,37 +853,46 @@ class PartUtils:
         # Simplified gear: create outer cylinder, cut tooth gaps
         gear = self.create_cylinder(f"{name}_blank", outer_dia/2, thickness)
 
-        # Create tooth cutter (simplified as wedge shapes)
-        tooth_angle = 360 / teeth
+        # Create tooth cutter (simplified as wedge shapes).
+        # Placement math runs in the vectorized (Numba-JIT'd when available)
+        # kernel instead of per-tooth math.cos/math.sin calls.
         cutter_width = module * 1.5
-
-        for i in range(teeth):
-            angle = math.radians(i * tooth_angle + tooth_angle/2)
-            # Position at root circle
-            x = (root_dia/2 + dedendum/2) * math.cos(angle)
-            y = (root_dia/2 + dedendum/2) * math.sin(angle)
-            
-            cutter = self.create_box(f"{name}_cut_{i}", cutter_width, dedendum*2, thickness*1.1,
-                                    center=True)
-            cutter.Placement.Base = Base.Vector(x, y, -thickness*0.05)
-            cutter.Placement.Rotation = FreeCAD.Rotation(Base.Vector(0,0,1), math.degrees(angle))
-            gear = self.cut_objects(gear, cutter)
+        placements = tooth_placements(teeth, root_dia/2 + dedendum/2)
+
+        z_axis = Base.Vector(0, 0, 1)
+        origin = Base.Vector(0, 0, 0)
+        cutters = []
+        for x, y, angle_deg in placements.tolist():
+            cutter = self._raw_box(cutter_width, dedendum*2, thickness*1.1)
+            cutter.rotate(origin, z_axis, angle_deg)
+            cutter.translate(Base.Vector(x, y, -thickness*0.05))
+            cutters.append(cutter)
+        # One boolean against all tooth cutters: OCC amortizes its
+        # intersection acceleration structures across the whole compound
+        # instead of rebuilding the gear BRep once per tooth. Intermediate
+        # results skip refinement; only the last boolean in the chain pays
+        # the removeSplitter pass.
+        has_hub = hub_dia > 0 and hub_height > 0
+        gear = self.cut_objects(gear, cutters,
+                                refine=not (has_hub or bore_dia > 0))
 
         # Hub
-        if hub_dia > 0 and hub_height > 0:
-            hub = self.create_cylinder(f"{name}_hub", hub_dia/2, hub_height,
-                                       position=Base.Vector(0, 0, thickness))
-            gear = self.fuse_objects([gear, hub])
+        if has_hub:
+            hub = self._raw_cylinder(hub_dia/2, hub_height,
+                                     position=Base.Vector(0, 0, thickness))
+            gear = self.fuse_objects([gear, hub], refine=bore_dia <= 0)
 
         # Bore
         if bore_dia > 0:
             total_h = thickness + (hub_height if hub_height > 0 else 0)
-            bore = self.create_cylinder(f"{name}_bore", bore_dia/2, total_h*1.1,
-                                       position=Base.Vector(0, 0, -total_h*0.05))
+            bore = self._raw_cylinder(bore_dia/2, total_h*1.1,
+                                      position=Base.Vector(0, 0, -total_h*0.05))
             gear = self.cut_objects(gear, bore)
 
         return self._validate(gear, f"create_spur_gear({name})")
 
+    @_brep_cached
+    @_deferred
     def create_pulley(self, name, outer_dia, bore_dia, width,
                      groove_count=1, groove_depth=3, groove_angle=40):
         """
@@ -484,19 +900,15 @@ class PartUtils:
         """
         pulley = self.create_cylinder(f"{name}_blank", outer_dia/2, width, center=True)
 
-        # Cut grooves
+        # Grooves + bore collected into one batched subtraction. Cutters are
+        # raw TopoShapes (no __dict__, no dependency pointers), so the
+        # accumulation list stays cheap even for many grooves.
         groove_spacing = width / (groove_count + 1)
-        for i in range(groove_count):
-            z = -width/2 + groove_spacing * (i + 1)
-            # V-groove is two cones meeting at center
-            groove_r = outer_dia/2 + groove_depth
-            groove = self.create_torus(f"{name}_groove_{i}", outer_dia/2, groove_depth,
-                                       position=Base.Vector(0, 0, z))
-            pulley = self.cut_objects(pulley, groove)
-
-        # Bore
-        bore = self.create_cylinder(f"{name}_bore", bore_dia/2, width*1.1, center=True)
-        pulley = self.cut_objects(pulley, bore)
+        cutters = [Part.makeTorus(outer_dia/2, groove_depth,
+                                  Base.Vector(0, 0, -width/2 + groove_spacing * (i + 1)))
+                   for i in range(groove_count)]
+        cutters.append(self._raw_cylinder(bore_dia/2, width*1.1, center=True))
+        pulley = self.cut_objects(pulley, cutters)
 
         return self._validate(pulley, f"create_pulley({name})")
 
@@ -505,25 +917,40 @@ class PartUtils:
     # ==========================================================================
 
     def create_tube(self, name, outer_dia, inner_dia, length, position=None):
-        """Simple tube/pipe."""
-        outer = self.create_cylinder(f"{name}_outer", outer_dia/2, length, position=position)
-        inner = self.create_cylinder(f"{name}_inner", inner_dia/2, length*1.1,
-                                    position=Base.Vector(
-                                        position.x if position else 0,
-                                        position.y if position else 0,
-                                        (position.z if position else 0) - length*0.05
-                                    ))
-        return self.cut_objects(outer, inner)
+        """Simple tube/pipe.
+
+        Built annularly at shape level from a dimension-keyed prototype:
+        no intermediate cylinder features, one boolean, one document
+        insertion."""
+        def build():
+            outer = Part.makeCylinder(outer_dia/2, length)
+            inner = Part.makeCylinder(inner_dia/2, length*1.1,
+                                      Base.Vector(0, 0, -length*0.05))
+            return outer.cut(inner)
+
+        feat = self.doc.addObject("Part::Feature", name)
+        feat.Shape = self._cached_shape(('tube', outer_dia, inner_dia, length), build)
+        if position:
+            feat.Placement.Base = position
+        self._recompute()
+        return self._validate(feat, f"create_tube({name})")
 
     def create_bushing(self, name, outer_dia, inner_dia, length, flange_dia=0, flange_thickness=0):
         """Bushing/bearing sleeve with optional flange."""
-        body = self.create_tube(name, outer_dia, inner_dia, length)
-
-        if flange_dia > 0 and flange_thickness > 0:
-            flange = self.create_cylinder(f"{name}_flange", flange_dia/2, flange_thickness)
-            body = self.fuse_objects([body, flange])
-
-        return self._validate(body, f"create_bushing({name})")
+        def build():
+            outer = Part.makeCylinder(outer_dia/2, length)
+            inner = Part.makeCylinder(inner_dia/2, length*1.1,
+                                      Base.Vector(0, 0, -length*0.05))
+            body = outer.cut(inner)
+            if flange_dia > 0 and flange_thickness > 0:
+                body = body.fuse(Part.makeCylinder(flange_dia/2, flange_thickness)).removeSplitter()
+            return body
+
+        feat = self.doc.addObject("Part::Feature", name)
+        feat.Shape = self._cached_shape(
+            ('bushing', outer_dia, inner_dia, length, flange_dia, flange_thickness), build)
+        self._recompute()
+        return self._validate(feat, f"create_bushing({name})")
 
     def create_shaft(self, name, diameter, length, keyway_width=0, keyway_depth=0, keyway_length=0):
         """Shaft with optional keyway."""
@@ -531,9 +958,8 @@ class PartUtils:
 
         if keyway_width > 0 and keyway_depth > 0:
             kw_len = keyway_length if keyway_length > 0 else length * 0.8
-            keyway = self.create_box(f"{name}_keyway", keyway_width, kw_len, keyway_depth,
-                                    center=True,
-                                    position=Base.Vector(0, 0, diameter/2 - keyway_depth/2))
+            keyway = self._raw_box(keyway_width, kw_len, keyway_depth,
+                                   position=Base.Vector(0, 0, diameter/2 - keyway_depth/2))
             shaft = self.cut_objects(shaft, keyway)
 
         return self._validate(shaft, f"create_shaft({name})")
@@ -542,21 +968,20 @@ class PartUtils:
         """Control knob with optional knurling (simplified as flats)."""
         knob = self.create_cylinder(f"{name}_body", diameter/2, height)
 
-        # Add grip flats
+        # Grip flats + bore collected into one batched subtraction; flat
+        # positions come from the shared polar kernel
+        cutters = []
         if knurl_count > 0:
             flat_depth = diameter * 0.05
-            for i in range(knurl_count):
-                angle = math.radians(i * 360 / knurl_count)
-                x = (diameter/2 + flat_depth/2) * math.cos(angle)
-                y = (diameter/2 + flat_depth/2) * math.sin(angle)
-                flat = self.create_box(f"{name}_flat_{i}", flat_depth*2, flat_depth*2, height*1.1,
-                                      center=True, position=Base.Vector(x, y, height/2))
-                knob = self.cut_objects(knob, flat)
+            for x, y in polar_coords(knurl_count, diameter/2 + flat_depth/2).tolist():
+                cutters.append(self._raw_box(flat_depth*2, flat_depth*2, height*1.1,
+                                             position=Base.Vector(x, y, height/2)))
 
         if bore_dia > 0:
-            bore = self.create_cylinder(f"{name}_bore", bore_dia/2, height*1.1,
-                                       position=Base.Vector(0, 0, -height*0.05))
-            knob = self.cut_objects(knob, bore)
+            cutters.append(self._raw_cylinder(bore_dia/2, height*1.1,
+                                              position=Base.Vector(0, 0, -height*0.05)))
+        if cutters:
+            knob = self.cut_objects(knob, cutters)
 
         return self._validate(knob, f"create_knob({name})")
 
@@ -564,16 +989,19 @@ class PartUtils:
     # TRANSFORMATIONS
     # ==========================================================================
 
+    # Placement-only transforms skip doc.recompute(): FreeCAD applies a
+    # Placement to the shape instance directly without re-evaluating any
+    # upstream parametric operation. Callers reading the moved object
+    # through a dependent feature must recompute themselves.
+
     def move_object(self, obj, vector):
         obj.Placement.Base = obj.Placement.Base + vector
-        self.doc.recompute()
         return obj
 
     def rotate_object(self, obj, axis, angle):
         """Rotates by angle (degrees) around axis."""
         rotation = FreeCAD.Rotation(axis, angle)
         obj.Placement.Rotation = rotation.multiply(obj.Placement.Rotation)
-        self.doc.recompute()
         return obj
 
     def mirror_object(self, obj, normal):
@@ -581,7 +1009,7 @@ class PartUtils:
         mirror = self.doc.addObject("Part::Mirroring", f"Mirror_{obj.Name}")
         mirror.Source = obj
         mirror.Normal = normal
-        self.doc.recompute()
+        self._recompute()
         return self._validate(mirror, "mirror_object")
 
     def copy_object(self, obj, new_name=None):
@@ -589,137 +1017,310 @@ class PartUtils:
             new_name = f"{obj.Name}_copy"
         new_obj = self.doc.addObject("Part::Feature", new_name)
         new_obj.Shape = obj.Shape.copy()
-        self.doc.recompute()
+        self._recompute()
         return self._validate(new_obj, f"copy_object({new_name})")
 
     def center_object(self, obj, axes="XYZ"):
         """Centers object on specified axes."""
-        bbox = obj.Shape.BoundBox
+        bbox = self.bbox(obj)
         move = Base.Vector(0, 0, 0)
         if "X" in axes: move.x = -bbox.Center.x
         if "Y" in axes: move.y = -bbox.Center.y
         if "Z" in axes: move.z = -bbox.Center.z
         obj.Placement.move(move)
-        self.doc.recompute()
         return obj
 
     # ==========================================================================
     # PATTERNS
     # ==========================================================================
 
+    def _fuse_shape_copies(self, obj, shapes, label):
+        """Fuses shape-level pattern copies into one document feature.
+
+        Copies live entirely in C++ TopoShape land — no per-copy document
+        object, no per-copy recompute. One multiFuse combines them and only
+        the result enters the dependency graph. Mirrors fuse_objects'
+        disjoint-solid check and consumes the source feature."""
+        fused = self._tree_fuse(shapes)
+        if fused.isNull() or fused.Volume < 0.001:
+            raise ValueError(f"{label}: fusion result is null or empty")
+        if len(fused.Solids) > 1:
+            raise ValueError(f"{label}: pattern copies do not intersect (disjoint solids). Reduce spacing.")
+        feat = self.doc.addObject("Part::Feature", label)
+        feat.Shape = fused.removeSplitter()
+        try:
+            self.doc.removeObject(obj.Name)
+        except Exception:
+            pass
+        self._recompute()
+        return self._validate(feat, label)
+
     def create_linear_pattern(self, obj, direction, spacing, count):
         """Linear array of objects."""
         if count <= 1:
             return obj
-        parts = [obj]
+        # Copy before normalizing: Vector.normalize() mutates in place and
+        # would silently change the caller's direction vector
+        d = Base.Vector(direction)
+        d.normalize()
+        src = obj.Shape
+        shapes = [src.copy()]
         for i in range(1, count):
-            new_obj = self.copy_object(obj, f"{obj.Name}_lin_{i}")
-            new_obj.Placement.Base = obj.Placement.Base + (direction.normalize() * spacing * i)
-            parts.append(new_obj)
-        self.doc.recompute()
-        return self.fuse_objects(parts)
+            s = src.copy()
+            s.translate(d * (spacing * i))
+            shapes.append(s)
+        return self._fuse_shape_copies(obj, shapes, f"{obj.Name}_lin")
 
     def create_rectangular_pattern(self, obj, dir1, spacing1, count1, dir2, spacing2, count2):
         """2D rectangular array."""
-        parts = []
+        d1 = Base.Vector(dir1)
+        d1.normalize()
+        d2 = Base.Vector(dir2)
+        d2.normalize()
+        # O(count1 + count2) precomputed offsets; the inner loop is one
+        # vector add per copy instead of two scaled multiplications
+        offsets_i = [d1 * (spacing1 * i) for i in range(count1)]
+        offsets_j = [d2 * (spacing2 * j) for j in range(count2)]
+        src = obj.Shape
+        shapes = []
         for i in range(count1):
             for j in range(count2):
-                if i == 0 and j == 0:
-                    parts.append(obj)
-                else:
-                    new_obj = self.copy_object(obj, f"{obj.Name}_rect_{i}_{j}")
-                    offset = (dir1.normalize() * spacing1 * i) + (dir2.normalize() * spacing2 * j)
-                    new_obj.Placement.Base = obj.Placement.Base + offset
-                    parts.append(new_obj)
-        self.doc.recompute()
-        return self.fuse_objects(parts)
+                s = src.copy()
+                if i or j:
+                    s.translate(offsets_i[i] + offsets_j[j])
+                shapes.append(s)
+        return self._fuse_shape_copies(obj, shapes, f"{obj.Name}_rect")
+
+    @_deferred
+    def create_pattern_copies(self, obj, positions):
+        """Batched copies of obj at an (N,3) array of absolute positions.
+
+        positions: NumPy array or sequence of (x, y, z) rows, e.g. from
+        np.meshgrid + column_stack. Copies are made at the shape level and
+        compounded in one pass, so N placements cost one document feature
+        instead of N copy_object/recompute round trips."""
+        import numpy as np
+        positions = np.asarray(positions, dtype=np.float64)
+        if positions.ndim != 2 or positions.shape[1] != 3:
+            raise ValueError("create_pattern_copies: positions must be (N, 3)")
+
+        # Hoist the loop invariants: one descriptor crossing for the source
+        # shape, plain floats for the base offset, local Vector alias
+        src = obj.Shape
+        base = obj.Placement.Base
+        bx, by, bz = base.x, base.y, base.z
+        Vec = Base.Vector
+        shapes = []
+        for x, y, z in positions.tolist():
+            s = src.copy()
+            s.translate(Vec(x - bx, y - by, z - bz))
+            shapes.append(s)
+
+        feat = self.doc.addObject("Part::Feature", f"{obj.Name}_pattern")
+        feat.Shape = Part.makeCompound(shapes)
+        self._recompute()
+        return self._validate(feat, "create_pattern_copies")
 
     def create_polar_pattern(self, obj, center, axis, count, angle=360):
         """Circular array around axis."""
         if count <= 1:
             return obj
-        angle_step = angle / count
-        parts = [obj]
-        for i in range(1, count):
-            new_obj = self.copy_object(obj, f"{obj.Name}_pol_{i}")
-            new_obj.Shape.rotate(center, axis, angle_step * i)
-            parts.append(new_obj)
-        self.doc.recompute()
-        return self.fuse_objects(parts)
+        import numpy as np
+        angles = (np.arange(1, count) * (angle / count)).tolist()
+        src = obj.Shape
+        shapes = [src.copy()]
+        for a in angles:
+            # transformed() emits the rotated copy in one C++ pass instead
+            # of copy() followed by an in-place rotate
+            pl = FreeCAD.Placement()
+            pl.Rotation = FreeCAD.Rotation(axis, a)
+            pl.Base = center - pl.Rotation.multVec(center)
+            shapes.append(src.transformed(pl.toMatrix()))
+        return self._fuse_shape_copies(obj, shapes, f"{obj.Name}_pol")
 
     # ==========================================================================
     # EDGE/FACE SELECTION
     # ==========================================================================
 
+    def _edge_index(self, obj):
+        """One-shot per-body edge index for select_edges.
+
+        Walks the topology once and hoists curve types, mid-edge tangents,
+        vertex Z values and XY centers into parallel NumPy arrays. Keyed by
+        (id, hashCode) so a body modified in place (new shape, same feature)
+        re-indexes, while repeat queries on the same body hit the dict.
+        """
+        import numpy as np
+        key = (id(obj), obj.Shape.hashCode())
+        index = self._edge_index_cache.get(key)
+        if index is not None:
+            return index
+
+        edges = obj.Shape.Edges
+        n = len(edges)
+        type_names = [type(e.Curve).__name__ for e in edges]
+        types = np.array(type_names) if n else np.array([], dtype=str)
+        # float32 is plenty for 0.5 mm selection tolerances and doubles the
+        # number of lanes per SIMD compare on big edge counts
+        tangents = np.full((n, 3), np.nan, dtype=np.float32)
+        centers = np.full((n, 2), np.nan, dtype=np.float32)
+        vz, owner = [], []
+        for i, e in enumerate(edges):
+            try:
+                ctype = type_names[i]
+                if ctype == 'Line':
+                    # Straight edges: direction is a vertex subtract, no
+                    # parametric curve evaluation
+                    d = e.Vertexes[1].Point - e.Vertexes[0].Point
+                    d.normalize()
+                    tangents[i] = (d.x, d.y, d.z)
+                elif ctype != 'Circle':
+                    # Circle tangents lie in the circle plane and never pass
+                    # an axis-alignment test; leave them NaN
+                    length = self._edge_length(e)
+                    t = e.tangentAt(length / 2.0 if length > 0 else 0)
+                    tangents[i] = (t.x, t.y, t.z)
+            except Exception:
+                pass  # NaN row never passes a direction comparison
+            try:
+                com = e.CenterOfMass
+                centers[i] = (com.x, com.y)
+            except Exception:
+                pass
+            for v in e.Vertexes:
+                vz.append(v.Z)
+                owner.append(i)
+
+        index = {
+            'n': n,
+            'types': types,
+            'tangents': tangents,
+            'centers': centers,
+            'vz': np.array(vz, dtype=np.float32) if vz else np.empty(0, dtype=np.float32),
+            'owner': np.array(owner, dtype=np.intp) if owner else np.empty(0, dtype=np.intp),
+        }
+        self._edge_index_cache[key] = index
+        return index
+
     def select_edges(self, obj, edge_type=None, direction=None, z_level=None,
-                    min_radius=None, max_radius=None):
+                    min_radius=None, max_radius=None, return_indices=False):
         """
         Select edges by criteria.
         edge_type: 'Circle', 'Line', 'BSpline'
         direction: 'X', 'Y', 'Z'
         z_level: edges at this Z (±0.5mm tolerance)
         min/max_radius: distance from Z axis
+
+        Edge geometry comes from the per-body index (one topology walk,
+        cached), then each criterion becomes a vectorized boolean mask — a
+        second query on the same body never re-iterates obj.Shape.Edges.
         """
-        selected = []
-        for i, edge in enumerate(obj.Shape.Edges):
-            match = True
+        import numpy as np
+        idx = self._edge_index(obj)
+        n = idx['n']
+        if n == 0:
+            return []
+
+        mask = np.ones(n, dtype=bool)
+
+        if edge_type:
+            mask &= np.char.find(idx['types'], edge_type) >= 0
+
+        if direction and mask.any():
+            axis = {'X': 0, 'Y': 1, 'Z': 2}.get(direction)
+            if axis is not None:
+                # CUT-THROAT FIX: Stricter tolerances (was 0.9)
+                mask &= np.abs(idx['tangents'][:, axis]) >= 0.999
+
+        if z_level is not None and mask.any():
+            hit = np.zeros(n, dtype=bool)
+            if idx['vz'].size:
+                hit[idx['owner'][np.abs(idx['vz'] - z_level) < 0.5]] = True
+            mask &= hit
+
+        if (min_radius is not None or max_radius is not None) and mask.any():
+            dist = idx.get('dist')
+            if dist is None:
+                dist = idx['dist'] = np.hypot(idx['centers'][:, 0], idx['centers'][:, 1])
+            if min_radius:
+                mask &= dist >= min_radius
+            if max_radius:
+                mask &= dist <= max_radius
+
+        hits = np.flatnonzero(mask)
+        logger.info(f"select_edges({edge_type}, {direction}, z={z_level}) -> {len(hits)}")
+        if return_indices:
+            # 0-based int array for apply_fillet/apply_chamfer - skips the
+            # 'EdgeN' string round trip entirely
+            return hits
+        return [f"Edge{i+1}" for i in hits]
+
+    def _edge_length(self, edge):
+        """Memoized edge.Length.
+
+        OCCT re-integrates the curve on every Length read — cheap for lines,
+        expensive for BSplines. The TShape hashCode is stable across wrapper
+        handles, so repeat fillet/selector passes over the same body reuse
+        the first evaluation."""
+        h = edge.hashCode()
+        length = self._edge_len_cache.get(h)
+        if length is None:
+            length = self._edge_len_cache[h] = edge.Length
+        return length
+
+    def _face_index(self, obj):
+        """One-shot per-body face index (see _edge_index).
+
+        Snapshots Shape.Faces once — the property rebuilds a Python list of
+        fresh TopoDS handles on every read — and hoists mid-face normals and
+        center Z into parallel NumPy arrays for the selectors and the
+        draft/shell face scans.
+        """
+        import numpy as np
+        key = (id(obj), obj.Shape.hashCode())
+        index = self._face_index_cache.get(key)
+        if index is not None:
+            return index
+
+        faces = obj.Shape.Faces
+        n = len(faces)
+        normals = np.full((n, 3), np.nan, dtype=np.float32)
+        center_z = np.full(n, np.nan, dtype=np.float32)
+        for i, f in enumerate(faces):
+            try:
+                nv = f.normalAt(0.5, 0.5).normalize()
+                normals[i] = (nv.x, nv.y, nv.z)
+            except Exception:
+                pass  # NaN row never passes a normal comparison
+            try:
+                center_z[i] = f.CenterOfMass.z
+            except Exception:
+                pass
 
-            if edge_type and edge_type not in str(type(edge.Curve)):
-                match = False
-
-            if direction and match:
-                try:
-                    v = edge.tangentAt(edge.Length / 2.0 if edge.Length > 0 else 0)
-                    # CUT-THROAT FIX: Stricter tolerances (was 0.9)
-                    # v.z (dot product with Z) should be near 0 for horizontal, near 1 for vertical
-                    if direction == 'Z':
-                        if abs(v.z) < 0.999: match = False
-                    elif direction == 'X':
-                        if abs(v.x) < 0.999: match = False
-                    elif direction == 'Y':
-                        if abs(v.y) < 0.999: match = False
-                except:
-                    match = False
-
-            if z_level is not None and match:
-                z_match = any(abs(v.Z - z_level) < 0.5 for v in edge.Vertexes)
-                if not z_match:
-                    match = False
-
-            if (min_radius is not None or max_radius is not None) and match:
-                com = edge.CenterOfMass
-                dist = math.sqrt(com.x**2 + com.y**2)
-                if min_radius and dist < min_radius: match = False
-                if max_radius and dist > max_radius: match = False
-
-            if match:
-                selected.append(f"Edge{i+1}")
-
-        logger.info(f"select_edges({edge_type}, {direction}, z={z_level}) -> {len(selected)}")
-        return selected
+        index = {'faces': faces, 'normals': normals, 'center_z': center_z}
+        self._face_index_cache[key] = index
+        return index
 
     def select_faces(self, obj, normal=None, z_level=None):
         """Select faces by normal direction or Z level."""
-        selected = []
-        for i, face in enumerate(obj.Shape.Faces):
-            match = True
+        import numpy as np
+        idx = self._face_index(obj)
+        if not idx['faces']:
+            return []
 
-            if normal and match:
-                try:
-                    n = face.normalAt(0.5, 0.5).normalize()
-                    if abs(n.dot(normal.normalize())) < 0.9:
-                        match = False
-                except:
-                    match = False
+        mask = np.ones(len(idx['faces']), dtype=bool)
 
-            if z_level is not None and match:
-                if abs(face.CenterOfMass.z - z_level) > 0.5:
-                    match = False
+        if normal:
+            target = Base.Vector(normal)
+            target.normalize()
+            dots = idx['normals'] @ np.array([target.x, target.y, target.z],
+                                             dtype=np.float32)
+            mask &= np.abs(dots) >= 0.9
 
-            if match:
-                selected.append(f"Face{i+1}")
+        if z_level is not None:
+            mask &= np.abs(idx['center_z'] - z_level) <= 0.5
 
-        return selected
+        return [f"Face{i+1}" for i in np.flatnonzero(mask)]
 
     def select_faces_by_normal(self, obj, normal_vector):
         """Legacy compatibility."""
@@ -738,7 +1339,11 @@ class PartUtils:
         if abs(angle) < 0.01:
             return obj
             
-        faces = [f for f in obj.Shape.Faces if abs(f.normalAt(0.5,0.5).dot(pull_direction)) < 0.1]
+        import numpy as np
+        idx = self._face_index(obj)
+        dots = idx['normals'] @ np.array([pull_direction.x, pull_direction.y,
+                                          pull_direction.z], dtype=np.float32)
+        faces = [idx['faces'][i] for i in np.flatnonzero(np.abs(dots) < 0.1)]
 
         if not faces:
             # CUT-THROAT FIX: Fail if no draftable faces found
@@ -759,7 +1364,7 @@ class PartUtils:
 
             draft = self.doc.addObject("Part::Feature", f"Draft_{obj.Name}")
             draft.Shape = new_shape
-            self.doc.recompute()
+            draft.purgeTouched()
             return self._validate(draft, "apply_draft")
 
         except Exception as e:
@@ -768,22 +1373,15 @@ class PartUtils:
 
     def create_shell(self, obj, thickness, open_face_direction='+Z'):
         """Shell/hollow operation using B-Rep makeThickSolid."""
-        direction_map = {
-            '+Z': Base.Vector(0,0,1), '-Z': Base.Vector(0,0,-1),
-            '+X': Base.Vector(1,0,0), '-X': Base.Vector(-1,0,0),
-            '+Y': Base.Vector(0,1,0), '-Y': Base.Vector(0,-1,0)
-        }
-        target = direction_map.get(open_face_direction, Base.Vector(0,0,1)).normalize()
+        target = _DIRECTION_MAP.get(open_face_direction, _DIRECTION_MAP['+Z'])
 
-        # Find faces to remove (open faces)
-        faces_to_remove = []
-        for i, f in enumerate(obj.Shape.Faces):
-            try:
-                n = f.normalAt(0.5, 0.5)
-                if n.dot(target) > 0.9:
-                    faces_to_remove.append(obj.Shape.Faces[i])
-            except:
-                pass
+        # Find faces to remove (open faces) via the cached face index —
+        # one Shape.Faces snapshot, one vectorized dot product
+        import numpy as np
+        idx = self._face_index(obj)
+        dots = idx['normals'] @ np.array([target.x, target.y, target.z],
+                                         dtype=np.float32)
+        faces_to_remove = [idx['faces'][i] for i in np.flatnonzero(dots > 0.9)]
 
         logger.info(f"create_shell: thickness={thickness}, removing {len(faces_to_remove)} faces")
 
@@ -809,50 +1407,71 @@ class PartUtils:
             
             shell = self.doc.addObject("Part::Feature", f"Shell_{obj.Name}")
             shell.Shape = new_shape
-            self.doc.recompute()
+            shell.purgeTouched()
             return self._validate(shell, "create_shell")
         except Exception as e:
             raise ValueError(f"create_shell failed: {e}")
 
-    def apply_fillet(self, obj, radius, edge_names=None, direction=None, z_level=None):
+    def apply_fillet(self, obj, radius=None, edge_names=None, direction=None,
+                     z_level=None, edge_radius_map=None):
         """Fillet edges. Select by edge_names OR by direction/z_level.
-        Automatically clamps radius to safe value if too large for edges."""
-        if not edge_names:
-            edge_names = self.select_edges(obj, direction=direction, z_level=z_level)
-        if not edge_names:
-            logger.warning(f"apply_fillet(R{radius}): no edges")
+
+        edge_radius_map ({'Edge3': 2.0, 'Edge7': 0.5, ...}) fillets several
+        radius groups in ONE fillet build — the expensive topology analysis
+        is amortized across all edges instead of re-run per radius."""
+        if edge_radius_map is None:
+            if edge_names is None or len(edge_names) == 0:
+                edge_names = self.select_edges(obj, direction=direction, z_level=z_level,
+                                               return_indices=True)
+            if len(edge_names) == 0:
+                logger.warning(f"apply_fillet(R{radius}): no edges")
+                return obj
+            edge_radius_map = dict.fromkeys(edge_names, radius)
+        elif not edge_radius_map:
+            logger.warning("apply_fillet: empty edge_radius_map")
             return obj
 
-        logger.info(f"apply_fillet: R{radius} on {len(edge_names)} edges")
+        logger.info(f"apply_fillet: {len(edge_radius_map)} edges")
 
         try:
-            edges = []
-            min_edge_len = float('inf')
-            for name in edge_names:
-                idx = int(name.replace("Edge", "")) - 1
-                if 0 <= idx < len(obj.Shape.Edges):
-                    edge = obj.Shape.Edges[idx]
-                    edges.append(edge)
-                    # Track minimum edge length for radius clamping
-                    if edge.Length < min_edge_len:
-                        min_edge_len = edge.Length
-
-            if not edges:
+            shape_edges = obj.Shape.Edges
+            entries = []  # (index, radius, edge)
+            seen = set()  # duplicate edges can segfault OCCT's fillet builder
+            for name, r in edge_radius_map.items():
+                # Accept 'EdgeN' names or 0-based ints straight from
+                # select_edges(return_indices=True)
+                idx = int(name[4:]) - 1 if isinstance(name, str) else int(name)
+                if 0 <= idx < len(shape_edges) and idx not in seen:
+                    seen.add(idx)
+                    edge = shape_edges[idx]
+                    # CUT-THROAT FIX: No silent clamping.
+                    # If radius is too large, FAIL LOUDLY so the agent knows to fix it.
+                    edge_len = self._edge_length(edge)
+                    max_safe_radius = (edge_len / 2) - 0.01
+                    if r > max_safe_radius:
+                        raise ValueError(f"Fillet R{r} too large for edge length {edge_len:.2f}. Max safe radius is {max_safe_radius:.2f}")
+                    entries.append((idx, r, edge))
+
+            if not entries:
                 return obj
 
-            # CUT-THROAT FIX: No silent clamping.
-            # If radius is too large, FAIL LOUDLY so the agent knows to fix it.
-            max_safe_radius = (min_edge_len / 2) - 0.01
-            if radius > max_safe_radius:
-                raise ValueError(f"Fillet R{radius} too large for edge length {min_edge_len:.2f}. Max safe radius is {max_safe_radius:.2f}")
-
-            new_shape = obj.Shape.makeFillet(radius, edges)
-            if new_shape.isNull():
-                raise ValueError(f"makeFillet(R{radius}) returned null")
-
-            fillet = self.doc.addObject("Part::Feature", f"Fillet_{obj.Name}")
-            fillet.Shape = new_shape
-            self.doc.recompute()
+            radii = {r for _, r, _ in entries}
+            if len(radii) == 1:
+                new_shape = obj.Shape.makeFillet(radii.pop(), [e for _, _, e in entries])
+                if new_shape.isNull():
+                    raise ValueError(f"makeFillet(R{radius}) returned null")
+                fillet = self.doc.addObject("Part::Feature", f"Fillet_{obj.Name}")
+                fillet.Shape = new_shape
+                # Shape is already final; mark up-to-date without a doc
+                # DAG traversal
+                fillet.purgeTouched()
+            else:
+                # Mixed radii: Part::Fillet feeds all (edge, radius) pairs to a
+                # single BRepFilletAPI_MakeFillet build
+                fillet = self.doc.addObject("Part::Fillet", f"Fillet_{obj.Name}")
+                fillet.Base = obj
+                fillet.Edges = [(idx + 1, r, r) for idx, r, _ in entries]
+                self._recompute(force=True)
             return self._validate(fillet, "apply_fillet")
 
         except Exception as e:
@@ -861,18 +1480,21 @@ class PartUtils:
 
     def apply_chamfer(self, obj, size, edge_names=None, direction=None, z_level=None):
         """Chamfer edges."""
-        if not edge_names:
-            edge_names = self.select_edges(obj, direction=direction, z_level=z_level)
-        if not edge_names:
+        if edge_names is None or len(edge_names) == 0:
+            edge_names = self.select_edges(obj, direction=direction, z_level=z_level,
+                                           return_indices=True)
+        if len(edge_names) == 0:
             logger.warning(f"apply_chamfer({size}): no edges")
             return obj
 
         try:
-            edges = []
-            for name in edge_names:
-                idx = int(name.replace("Edge", "")) - 1
-                if 0 <= idx < len(obj.Shape.Edges):
-                    edges.append(obj.Shape.Edges[idx])
+            # Snapshot once: Shape.Edges rebuilds its list per property read
+            shape_edges = obj.Shape.Edges
+            # dict.fromkeys dedups while keeping order - duplicate edges can
+            # segfault OCCT's chamfer/fillet builder
+            idxs = dict.fromkeys(int(n[4:]) - 1 if isinstance(n, str) else int(n)
+                                 for n in edge_names)
+            edges = [shape_edges[i] for i in idxs if 0 <= i < len(shape_edges)]
 
             if not edges:
                 return obj
@@ -883,7 +1505,7 @@ class PartUtils:
 
             chamfer = self.doc.addObject("Part::Feature", f"Chamfer_{obj.Name}")
             chamfer.Shape = new_shape
-            self.doc.recompute()
+            chamfer.purgeTouched()
             return self._validate(chamfer, "apply_chamfer")
 
         except Exception as e:
@@ -893,20 +1515,137 @@ class PartUtils:
     # BOOLEAN OPERATIONS
     # ==========================================================================
 
-    def cut_objects(self, base, tool):
-        """Boolean subtraction: base - tool."""
+    def _release(self, objs):
+        """Removes consumed document features after a boolean.
+
+        Keeping inputs linked from the document retains every intermediate
+        BRep, so long chains (box -> shell -> boss-fuse -> fillet) balloon
+        peak RSS. Raw shapes pass through — they free with GC."""
+        for stale in objs:
+            name = getattr(stale, 'Name', None)
+            if name:
+                try:
+                    self.doc.removeObject(name)
+                except Exception:
+                    pass  # already removed / still referenced elsewhere
+
+    def refine_shape(self, obj):
+        """One-shot removeSplitter on a feature's final shape.
+
+        Pairs with refine=False on intermediate booleans: collapse co-planar
+        faces once at the end of a chain instead of after every step."""
+        obj.Shape = obj.Shape.removeSplitter()
+        obj.purgeTouched()
+        return obj
+
+    def cut_objects(self, base, tool, refine=True):
+        """Boolean subtraction: base - tool.
+
+        base and tool may be document features or raw TopoShapes (_raw_box/
+        _raw_cylinder); tool may also be a list. Lists are combined into one
+        compound cutter so OCC performs a single boolean subtraction instead
+        of rebuilding the BRep once per feature. The cut runs at shape level
+        — no Part::Cut feature, no parametric history — and consumed input
+        features are dropped from the document. Pass refine=False on
+        intermediate results that feed straight into another boolean and
+        refine_shape() the final body once."""
         try:
-            cut = self.doc.addObject("Part::Cut", f"Cut_{base.Name}")
-            cut.Base = base
-            cut.Tool = tool
-            cut.Refine = True
-            self.doc.recompute()
-            return self._validate(cut, "cut_objects")
+            tools = list(tool) if isinstance(tool, (list, tuple)) else [tool]
+            if not tools:
+                raise ValueError("cut_objects: empty tool list")
+            shapes = [self._as_shape(t) for t in tools]
+            cutter = shapes[0] if len(shapes) == 1 else Part.makeCompound(shapes)
+            result = self._as_shape(base).cut(cutter)
+            if result.isNull():
+                raise ValueError("cut returned null shape")
+            label = f"Cut_{getattr(base, 'Name', 'Shape')}"
+            feat = self.doc.addObject("Part::Feature", label)
+            feat.Shape = result.removeSplitter() if refine else result
+            self._release([base] + tools)
+            self._recompute()
+            return self._validate(feat, "cut_objects")
         except Exception as e:
             raise ValueError(f"cut_objects failed: {e}")
 
-    def fuse_objects(self, objects):
-        """Boolean union. Falls back to compound for non-intersecting bodies."""
+    def cut_objects_partitioned(self, base, tools, num_divisions=2):
+        """Spatially partitioned boolean cut for many localized cutters.
+
+        Splits the base bounding box into an n x n XY grid, cuts each cell
+        only with the cutters whose bounding boxes overlap it, then fuses the
+        cells back together. Each boolean stays local to its subregion, so
+        edges far from a cutter are never re-evaluated — OCC boolean cost is
+        super-linear in shape complexity, which makes the stitched result
+        cheaper than one cut against the full body for feature arrays."""
+        if not isinstance(tools, (list, tuple)):
+            tools = [tools]
+        if num_divisions <= 1 or len(tools) <= 1:
+            return self.cut_objects(base, list(tools))
+
+        base_shape = self._as_shape(base)
+        bb = self.bbox(base) if hasattr(base, 'Shape') else base_shape.BoundBox
+        pad = 1.0  # Z overshoot so through-cutters clear the cells
+        dx = bb.XLength / num_divisions
+        dy = bb.YLength / num_divisions
+
+        logger.info(f"cut_objects_partitioned: {num_divisions}x{num_divisions} grid, {len(tools)} cutters")
+
+        pieces = []
+        for i in range(num_divisions):
+            for j in range(num_divisions):
+                x0 = bb.XMin + i * dx
+                y0 = bb.YMin + j * dy
+                cell = Part.makeBox(dx, dy, bb.ZLength + 2 * pad,
+                                    Base.Vector(x0, y0, bb.ZMin - pad))
+                piece = base_shape.common(cell)
+                if piece.isNull() or piece.Volume < 0.001:
+                    continue
+
+                # Only cutters whose bbox overlaps this cell participate.
+                # Compound tools (pattern copies) are exploded into their
+                # solids so locality is judged per feature, not per compound.
+                local = []
+                for tool in tools:
+                    tool_shape = self._as_shape(tool)
+                    for sub in (tool_shape.Solids or [tool_shape]):
+                        tb = sub.BoundBox
+                        if (tb.XMax >= x0 and tb.XMin <= x0 + dx and
+                                tb.YMax >= y0 and tb.YMin <= y0 + dy):
+                            local.append(sub)
+                if local:
+                    piece = piece.cut(Part.makeCompound(local))
+                pieces.append(piece)
+
+        if not pieces:
+            raise ValueError("cut_objects_partitioned: no material left after partitioning")
+
+        result = pieces[0] if len(pieces) == 1 else pieces[0].multiFuse(pieces[1:])
+        result = result.removeSplitter()
+
+        feat = self.doc.addObject("Part::Feature", f"Cut_{getattr(base, 'Name', 'Shape')}")
+        feat.Shape = result
+        self._release([base] + list(tools))
+        self._recompute()
+        return self._validate(feat, "cut_objects_partitioned")
+
+    def _tree_fuse(self, shapes):
+        """Balanced pairwise fusion of a list of TopoShapes.
+
+        OCCT boolean cost grows super-linearly with operand face count, so
+        for 4+ operands fusing halves recursively keeps every intermediate
+        B-rep small instead of accreting faces one operand at a time. Small
+        lists go straight through multiFuse."""
+        if len(shapes) < 4:
+            return shapes[0] if len(shapes) == 1 else shapes[0].multiFuse(shapes[1:])
+        mid = len(shapes) // 2
+        return self._tree_fuse(shapes[:mid]).fuse(self._tree_fuse(shapes[mid:]))
+
+    def fuse_objects(self, objects, refine=True):
+        """Boolean union of document features and/or raw TopoShapes.
+
+        Runs one shape-level multiFuse; consumed input features are dropped
+        from the document so long chains don't retain every intermediate
+        body. refine=False skips the removeSplitter pass for intermediates
+        (see cut_objects)."""
         if not objects:
             raise ValueError("fuse_objects: empty list")
         if len(objects) == 1:
@@ -915,22 +1654,24 @@ class PartUtils:
         logger.info(f"fuse_objects: {len(objects)} objects")
 
         try:
-            fuse = self.doc.addObject("Part::MultiFuse", "Fusion")
-            fuse.Shapes = objects
-            fuse.Refine = True
-            self.doc.recompute()
-            
+            shapes = [self._as_shape(o) for o in objects]
+            fused = self._tree_fuse(shapes)
+
             # Check if fusion produced valid geometry
-            if fuse.Shape.isNull() or fuse.Shape.Volume < 0.001:
+            if fused.isNull() or fused.Volume < 0.001:
                 raise ValueError("Fusion result is null or empty")
-            
+
             # CUT-THROAT FIX: Ensure single solid result
-            if len(fuse.Shape.Solids) > 1:
+            if len(fused.Solids) > 1:
                 raise ValueError("Fusion created disjoint solids (parts DO NOT intersect). Move parts closer.")
 
-            return self._validate(fuse, "fuse_objects")
+            feat = self.doc.addObject("Part::Feature", "Fusion")
+            feat.Shape = fused.removeSplitter() if refine else fused
+            self._release(objects)
+            self._recompute()
+            return self._validate(feat, "fuse_objects")
         except Exception as e:
-            # CUT-THROAT FIX: No compound fallback. 
+            # CUT-THROAT FIX: No compound fallback.
             # If fusion fails, the geometry is invalid for manufacturing.
             raise ValueError(f"fuse_objects failed: {e} (Ensure objects intersect and are valid solids)")
 
@@ -940,11 +1681,19 @@ class PartUtils:
             return objects[0] if objects else None
 
         try:
-            common = self.doc.addObject("Part::MultiCommon", "Intersection")
-            common.Shapes = objects
-            common.Refine = True
-            self.doc.recompute()
-            return self._validate(common, "intersect_objects")
+            shapes = [self._as_shape(o) for o in objects]
+            result = shapes[0]
+            for s in shapes[1:]:
+                result = result.common(s)
+
+            if result.isNull() or result.Volume < 0.001:
+                raise ValueError("Intersection result is null or empty")
+
+            feat = self.doc.addObject("Part::Feature", "Intersection")
+            feat.Shape = result.removeSplitter()
+            self._release(objects)
+            self._recompute()
+            return self._validate(feat, "intersect_objects")
         except Exception as e:
             raise ValueError(f"intersect_objects failed: {e}")
 
@@ -952,41 +1701,164 @@ class PartUtils:
     # EXPORT
     # ==========================================================================
 
-    def export_step(self, obj, file_path):
+    def export_step(self, obj, file_path, compress=None):
+        """STEP export, optionally gzip-compressed (.stpZ).
+
+        compress defaults to the module STEP_COMPRESS flag so a deployment
+        can switch every script over without edits; an explicit ".step"
+        extension always stays plain ASCII for downstream compatibility.
+        compresslevel=1 gives ~3x size reduction at minimal CPU."""
         import Import
         self._safe_path(file_path)
         self._validate(obj, "export_step input")
 
-        if not obj.Shape.isValid():
+        if compress is None:
+            compress = STEP_COMPRESS
+        compress = compress and not file_path.endswith('.step')
+
+        cache_path = self._cache_path(".step",
+                                      extra=(_trace_repr(obj), compress))
+        if self._cache_fetch(cache_path, file_path):
+            return
+
+        if not self._shape_valid(obj.Shape):
             logger.warning("Shape invalid, attempting kernel fix...")
             obj.Shape.fix(0.01, 0.01, 0.01)
-            if not obj.Shape.isValid():
+            if not self._shape_valid(obj.Shape):
                 # CUT-THROAT FIX: Do not ship broken geometry.
                 raise ValueError("Export Failed: Geometry is invalid (non-manifold or self-intersecting) and could not be healed.")
 
-        Import.export([obj], file_path)
+        if compress:
+            # OCC picks the format from the extension, so write ASCII STEP
+            # to a scratch path and stream it through gzip.
+            tmp_path = file_path + '.tmp.step'
+            Import.export([obj], tmp_path)
+            try:
+                with open(tmp_path, 'rb') as src, \
+                        gzip.open(file_path, 'wb', compresslevel=1) as dst:
+                    shutil.copyfileobj(src, dst)
+            finally:
+                os.remove(tmp_path)
+        else:
+            Import.export([obj], file_path)
 
-        if not os.path.exists(file_path) or os.path.getsize(file_path) < 100:
+        if not _check_export(file_path):
             raise ValueError(f"STEP export failed: {file_path}")
+        self._cache_store(cache_path, file_path)
         logger.info(f"Exported: {file_path}")
 
-    def export_stl(self, obj, file_path, tolerance=0.05):
+    def _tessellate(self, shape, tolerance):
+        """Tessellates once per (shape, tolerance); repeats hit the cache."""
+        key = (shape.hashCode(), tolerance)
+        mesh = self._mesh_cache.get(key)
+        if mesh is None:
+            mesh = shape.tessellate(tolerance)
+            self._mesh_cache[key] = mesh
+        return mesh
+
+    def _stl_tolerance(self, obj, tolerance, ratio):
+        """Resolves the tessellation deflection for an export.
+
+        With ratio set, deflection scales with the body's bounding-box
+        diagonal: small curved parts get fine meshes, large parts avoid
+        multi-million-triangle blowups. Absolute tolerance wins when both
+        are given explicitly."""
+        if ratio is None:
+            return tolerance
+        diag = self.bbox(obj).DiagonalLength
+        return max(diag * ratio, 1e-4)
+
+    def export_both(self, obj, step_path, stl_path, ratio=None):
+        """Exports STEP and STL concurrently.
+
+        The two exports share no state after the body is final; running them
+        in a 2-worker thread pool hides STL tessellation time behind STEP
+        serialization (OCC releases the GIL during both). The mesh is
+        tessellated up front so the STL worker only packs and writes."""
+        from concurrent.futures import ThreadPoolExecutor
+        self._validate(obj, "export_both input")
+        if self._shape_valid(obj.Shape):
+            self._tessellate(obj.Shape, self._stl_tolerance(obj, 0.05, ratio))
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            futures = [ex.submit(self.export_step, obj, step_path),
+                       ex.submit(self.export_stl, obj, stl_path, ratio=ratio)]
+            for f in futures:
+                f.result()
+
+    def _write_stl_fast(self, shape, file_path, tolerance):
+        """Struct-packed binary STL writer.
+
+        Packs the tessellation into one contiguous record array (normal +
+        3 vertices + attribute word per triangle) and writes header, count
+        and payload in a single pass — avoids the per-triangle iostream
+        formatting of the stock OCC STL writer."""
+        import numpy as np
+        verts, facets = self._tessellate(shape, tolerance)
+        if not facets:
+            raise ValueError("export_stl: tessellation produced no triangles")
+
+        v = np.asarray(verts, dtype=np.float64)
+        f = np.asarray(facets, dtype=np.intp)
+        tri = v[f]  # (n, 3, 3)
+        normals = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+        lengths = np.linalg.norm(normals, axis=1)
+        lengths[lengths == 0] = 1.0
+        normals /= lengths[:, None]
+
+        rec = np.zeros(len(f), dtype=np.dtype(
+            [('n', '<f4', 3), ('v', '<f4', (3, 3)), ('attr', '<u2')]))
+        rec['n'] = normals
+        rec['v'] = tri
+
+        with open(file_path, 'wb') as fh:
+            fh.write(b'text-to-cad binary STL'.ljust(80, b' '))
+            fh.write(np.uint32(len(f)).tobytes())
+            fh.write(rec.tobytes())
+
+    def export_stl(self, obj, file_path, tolerance=0.05, ratio=None, fast=True):
         self._safe_path(file_path)
         self._validate(obj, "export_stl input")
-        
+
+        tolerance = self._stl_tolerance(obj, tolerance, ratio)
+        cache_path = self._cache_path(".stl",
+                                      extra=(_trace_repr(obj), tolerance))
+        if self._cache_fetch(cache_path, file_path):
+            return
+
         # CUT-THROAT FIX: Strict pre-tessellation check
-        if not obj.Shape.isValid():
+        if not self._shape_valid(obj.Shape):
              logger.warning("Shape invalid, attempting kernel fix...")
              obj.Shape.fix(0.01, 0.01, 0.01)
-             if not obj.Shape.isValid():
+             if not self._shape_valid(obj.Shape):
                  raise ValueError("Export Failed: Geometry is invalid (non-manifold or self-intersecting).")
 
-        mesh_obj = self.doc.addObject("Mesh::Feature", "ExportMesh")
-        mesh_obj.Mesh = Mesh.Mesh(obj.Shape.tessellate(tolerance))
-        mesh_obj.Mesh.write(file_path)
+        written = False
+        if fast and (obj.Shape.hashCode(), tolerance) in self._mesh_cache:
+            # export_both pre-warmed this tessellation — pack and write it
+            try:
+                self._write_stl_fast(obj.Shape, file_path, tolerance)
+                written = True
+            except ImportError:
+                logger.warning("numpy unavailable, falling back to Mesh writer")
+        if not written:
+            try:
+                # Tessellation and mesh construction stay in C++ — the Python
+                # vertex/facet lists from Shape.tessellate never materialize
+                import MeshPart
+                MeshPart.meshFromShape(
+                    Shape=obj.Shape, LinearDeflection=tolerance,
+                    AngularDeflection=0.5, Relative=False).write(file_path)
+            except ImportError:
+                try:
+                    self._write_stl_fast(obj.Shape, file_path, tolerance)
+                except ImportError:
+                    mesh_obj = self.doc.addObject("Mesh::Feature", "ExportMesh")
+                    mesh_obj.Mesh = Mesh.Mesh(self._tessellate(obj.Shape, tolerance))
+                    mesh_obj.Mesh.write(file_path)
 
-        if not os.path.exists(file_path) or os.path.getsize(file_path) < 100:
+        if not _check_export(file_path):
             raise ValueError(f"STL export failed: {file_path}")
+        self._cache_store(cache_path, file_path)
         logger.info(f"Exported: {file_path}")
 
     # ==========================================================================
@@ -1001,7 +1873,7 @@ class PartUtils:
         helix.Radius = radius
         if radius2:
             helix.Radius2 = radius2
-        self.doc.recompute()
+        self._recompute(force=True)
         return helix
 
     # ==========================================================================
@@ -1012,7 +1884,7 @@ class PartUtils:
         """Returns dict with bbox dimensions and center."""
         if not hasattr(obj, 'Shape') or obj.Shape.isNull():
             raise ValueError("Cannot get bbox of null shape")
-        bb = obj.Shape.BoundBox
+        bb = self.bbox(obj)
         return {
             'min': (bb.XMin, bb.YMin, bb.ZMin),
             'max': (bb.XMax, bb.YMax, bb.ZMax),
@@ -1058,7 +1930,7 @@ class PartUtils:
         extrude.Dir = Base.Vector(0, 0, distance)
         extrude.Solid = True
         extrude.Symmetric = symmetric
-        self.doc.recompute()
+        self._recompute(force=True)
         return self._validate(extrude, "extrude_profile")
 
     def revolve_profile(self, name, sketch_or_face, axis_dir, angle=360):
@@ -1068,7 +1940,7 @@ class PartUtils:
         revolve.Axis = axis_dir # tuple (x,y,z) or Vector
         revolve.Angle = angle
         revolve.Solid = True
-        self.doc.recompute()
+        self._recompute(force=True)
         return self._validate(revolve, "revolve_profile")
 
     def loft_profiles(self, name, profiles, solid=True, ruled=False):
@@ -1077,5 +1949,110 @@ class PartUtils:
         loft.Sections = profiles
         loft.Solid = solid
         loft.Ruled = ruled
-        self.doc.recompute()
+        self._recompute(force=True)
         return self._validate(loft, "loft_profiles")
+
+
+# ==============================================================================
+# SCRIPT COMPILATION (trace -> flat replay script)
+# ==============================================================================
+
+class ScriptRecorder:
+    """Proxy around a PartUtils that records every executed call.
+
+    Used by compile_script to partially evaluate a generate_model function:
+    the function runs once for real, and the recorder captures the straight-
+    line sequence of utils calls that actually executed — loops unrolled,
+    branches resolved, constants inlined."""
+
+    def __init__(self, utils, step_path=None, stl_path=None):
+        self._utils = utils
+        self._lines = []
+        self._names = {}      # id(value) -> emitted variable name
+        self._keepalive = []  # prevents id reuse while recording
+        self._counter = 0
+        if step_path is not None:
+            self._register(step_path, "step_path")
+        if stl_path is not None:
+            self._register(stl_path, "stl_path")
+
+    def __getattr__(self, attr):
+        target = getattr(self._utils, attr)
+        if attr.startswith('_') or not callable(target):
+            return target
+
+        def wrapper(*args, **kwargs):
+            result = target(*args, **kwargs)
+            rendered = [self._render(a) for a in args]
+            rendered += [f"{k}={self._render(v)}" for k, v in kwargs.items()]
+            call = f"utils.{attr}({', '.join(rendered)})"
+            self._lines.append((self._bind(result), call))
+            return result
+        return wrapper
+
+    def _register(self, value, var):
+        self._names[id(value)] = var
+        self._keepalive.append(value)
+
+    def _bind(self, result):
+        if result is None:
+            return None
+        if isinstance(result, tuple):
+            return ", ".join(self._bind(r) or "_" for r in result)
+        var = f"v{self._counter}"
+        self._counter += 1
+        self._register(result, var)
+        return var
+
+    def _render(self, value):
+        var = self._names.get(id(value))
+        if var is not None:
+            return var
+        if isinstance(value, Base.Vector):
+            return f"Base.Vector({value.x!r}, {value.y!r}, {value.z!r})"
+        if isinstance(value, list):
+            return "[" + ", ".join(self._render(v) for v in value) + "]"
+        if isinstance(value, tuple):
+            inner = ", ".join(self._render(v) for v in value)
+            return f"({inner},)" if len(value) == 1 else f"({inner})"
+        if type(value).__module__ == "numpy":
+            # ndarrays and numpy scalars replay as plain literals: the
+            # emitted script imports only Base, so array([...]) or
+            # np.float64(1.0) reprs would NameError at replay
+            return self._render(value.tolist())
+        return repr(value)
+
+    def emit(self):
+        """Returns the recorded calls as a flat generate_model script."""
+        body = []
+        for target, call in self._lines:
+            body.append(f"    {call}" if target is None else f"    {target} = {call}")
+        if not body:
+            body.append("    pass")
+        return ("def generate_model(utils, step_path, stl_path):\n"
+                "    from FreeCAD import Base\n" + "\n".join(body) + "\n")
+
+
+def compile_script(generate_model, step_path, stl_path, utils=None):
+    """Partially evaluates generate_model into a flat replay script.
+
+    Executes the function once against a recording PartUtils and emits a
+    script of only the calls that ran, with all constants inlined. The
+    emitted script is cached under CACHE_DIR keyed by the call-trace hash,
+    so fixed prompts replay without re-running the original control flow.
+    Returns (script_text, cache_path)."""
+    if utils is None:
+        utils = PartUtils()
+    recorder = ScriptRecorder(utils, step_path, stl_path)
+    generate_model(recorder, step_path, stl_path)
+    script = recorder.emit()
+
+    digest = hashlib.blake2b(repr(utils._trace).encode(), digest_size=16).hexdigest()
+    cache_path = os.path.join(CACHE_DIR, f"{digest}.py")
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(cache_path, "w") as f:
+            f.write(script)
+    except OSError as e:
+        logger.warning(f"compile_script cache write failed: {e}")
+    return script, cache_path
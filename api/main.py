@@ -26,20 +26,88 @@ else:
     load_dotenv()
 
 import asyncio
+import hashlib
+import random
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 import uuid
-import zipfile
+import struct
+import zlib
 import time
 from fastapi import FastAPI, HTTPException, BackgroundTasks, UploadFile, File, Form
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from typing import Optional, List, Annotated
+from dataclasses import dataclass
 from pydantic import BaseModel
+import functools
 import json
-from pipeline import AgentPipeline
 import logging
+import numpy as np
 import trimesh
 
+# Optional: exec into pooled containers over the Docker socket instead of
+# forking the docker CLI (~tens of ms per request). Falls back silently.
+try:
+    import aiodocker
+except ImportError:
+    aiodocker = None
+
+# Hot-path JSON: orjson (Rust) decodes/encodes 2-5x faster than stdlib
+# and matters on the per-request parse/dump sites. Falls back to stdlib
+# with compact separators when not installed. Both raise ValueError
+# subclasses on bad input.
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+# Gemini raises this on per-minute quota exhaustion. Ships with
+# google-generativeai; the fallback class just keeps the except clause
+# valid if the transport stack changes.
+try:
+    from google.api_core.exceptions import ResourceExhausted
+except ImportError:
+    class ResourceExhausted(Exception):
+        pass
+
+
+@functools.cache
+def _get_pipeline_cls():
+    """
+    Lazily imports AgentPipeline on the first /generate request.
+
+    pipeline.py pulls in google.generativeai (heavy), which /render and
+    startup never need - deferring the import keeps cold start fast.
+    """
+    from pipeline import AgentPipeline
+    return AgentPipeline
+
+
+@functools.lru_cache(maxsize=32)
+def _get_pipeline(api_key: str, model_name: str):
+    """
+    Pipeline instances cached per (api_key, model).
+
+    Construction configures the genai SDK and builds the model wrapper, so
+    the common single-key deployment pays it once and keeps reusing the
+    same HTTPS connection pool and server-side prompt cache handle across
+    requests. Bounded per process by the LRU.
+    """
+    return _get_pipeline_cls()(api_key=api_key, model_name=model_name)
+
 # Configure structured logging for production observability
 logging.basicConfig(
     level=logging.INFO,
@@ -74,9 +142,54 @@ GEMINI_MODEL = os.environ.get("GEMINI_MODEL", "gemini-3-flash-preview")
 
 # Docker Configuration - configurable paths for different deployment environments
 DOCKER_RUNNER_IMAGE = os.environ.get("DOCKER_RUNNER_IMAGE", "geometry-runner")
-TEMP_DIR = Path(os.environ.get("TEMP_DIR", "/tmp/geometry_jobs"))
+# Job directories default to tmpfs (/dev/shm) when the host has one, so
+# scripts and copied-back exports never touch disk; TEMP_DIR env overrides.
+_default_tmp = "/dev/shm/geometry_jobs" if os.path.isdir("/dev/shm") else "/tmp/geometry_jobs"
+TEMP_DIR = Path(os.environ.get("TEMP_DIR", _default_tmp))
 TEMP_DIR.mkdir(parents=True, exist_ok=True)
 
+# Container pool: reuse long-running sandbox containers via `docker exec`
+# instead of paying ~300-800ms of `docker run --rm` startup per script.
+# Set DOCKER_POOL=0 to force one-shot containers (e.g. rootless setups
+# where a persistent bind mount is undesirable). DOCKER_POOL_SIZE bounds
+# how many warm containers are kept per library path.
+DOCKER_POOL = os.environ.get("DOCKER_POOL", "1") == "1"
+DOCKER_POOL_SIZE = int(os.environ.get("DOCKER_POOL_SIZE", min(os.cpu_count() or 1, 4)))
+
+# How pooled containers wait between jobs:
+#   keep_alive - idle running on `sleep infinity` (lowest latency, default)
+#   pause      - `docker pause`d between execs; frees their CPU scheduling
+#                entirely at the cost of an unpause round trip per job
+#   none       - no reuse, one-shot `docker run` per script
+CONTAINER_REUSE_STRATEGY = os.environ.get(
+    "CONTAINER_REUSE_STRATEGY", "keep_alive" if DOCKER_POOL else "none")
+
+# Response cache: repeated identical /generate requests (same prompt,
+# constraints, previous_code, uploads and format) skip both Gemini calls
+# and the sandbox entirely and re-serve the stored artifact.
+RESPONSE_CACHE = os.environ.get("RESPONSE_CACHE", "1") == "1"
+RESPONSE_CACHE_DIR = Path(os.environ.get("RESPONSE_CACHE_DIR", "/var/tmp/t2s_responses"))
+
+# Cap on in-flight Gemini pipeline runs. Each /generate issues up to 3
+# spec+code call pairs, so under load an unbounded fan-out trips the
+# per-minute quota and the resulting 429s burn retry budget. Queueing on
+# a semaphore is cheap; failing on quota is not.
+GEMINI_MAX_CONCURRENCY = int(os.environ.get("GEMINI_MAX_CONCURRENCY", "8"))
+_gemini_limiter = asyncio.Semaphore(GEMINI_MAX_CONCURRENCY)
+
+# Backpressure for the sandbox: allow a small queue on top of the pool,
+# then shed load with a 503 instead of letting bursts pile up on the
+# event loop holding worker slots. Clients retry with backoff.
+SANDBOX_MAX_INFLIGHT = int(os.environ.get(
+    "SANDBOX_MAX_INFLIGHT", str(DOCKER_POOL_SIZE * 2)))
+_sandbox_slots = asyncio.Semaphore(SANDBOX_MAX_INFLIGHT)
+_sandbox_rejections = 0
+
+# Content-addressed store for uploaded reference files: each upload is
+# hashed once on arrival and kept at <dir>/<digest>, so identical files
+# dedupe and their digests feed the response-cache key.
+UPLOAD_STORE_DIR = Path(os.environ.get("UPLOAD_STORE_DIR", "/var/tmp/t2s_uploads"))
+
 # Security Configuration
 ALLOWED_ORIGINS = os.environ.get("ALLOWED_ORIGINS", "*").replace(";", ",").split(",")
 origins = [o.strip() for o in ALLOWED_ORIGINS if o.strip()]
@@ -112,57 +225,146 @@ app.add_middleware(
 # Mesh Validation
 # ============================================================================
 
-def validate_mesh(stl_path: str) -> None:
+def validate_mesh(stl_path: str) -> Optional["trimesh.Trimesh"]:
     """
     Validates generated mesh for production readiness.
-    
+
     Checks:
     - Non-empty geometry
     - Watertight (manifold) mesh
     - Positive volume
     - Valid face count
-    
+
     Raises GeometryError if validation fails, triggering pipeline retry.
+    Returns the parsed mesh so callers can reuse it (parsing a multi-MB
+    STL twice per request was pure overhead); None if the file is missing
+    or unparseable.
     """
     if not os.path.exists(stl_path):
-        return
-    
+        return None
+
     try:
         mesh = trimesh.load(stl_path, force='mesh')
-        
+
         if mesh.is_empty:
             raise GeometryError("Generated mesh is empty.")
-        
+
+        if len(mesh.faces) == 0:
+            raise GeometryError("Generated mesh has no faces.")
+
+        # Cheap necessary conditions before the O(F log F) adjacency build
+        # inside is_watertight: a closed triangle surface has E = 3F/2 (so
+        # 3F must be even) and an even Euler characteristic (2 - 2*genus —
+        # tubes and pulleys are genus >= 1, so testing against exactly 2
+        # would false-reject valid parts).
+        V, F = len(mesh.vertices), len(mesh.faces)
+        if (3 * F) % 2 != 0 or (V - (3 * F) // 2 + F) % 2 != 0:
+            raise GeometryError("Generated mesh is not watertight (euler check).")
+
         if not mesh.is_watertight:
             raise GeometryError("Generated mesh is not watertight (non-manifold).")
-        
-        if mesh.volume <= 0:
+
+        # Signed volume straight from the triangle array already in memory
+        tri = mesh.triangles
+        volume = float(np.einsum('ij,ij->i', tri[:, 0],
+                                 np.cross(tri[:, 1], tri[:, 2])).sum()) / 6.0
+        if volume <= 0:
             raise GeometryError("Generated mesh has zero or negative volume.")
-        
-        if len(mesh.faces) == 0:
-            raise GeometryError("Generated mesh has no faces.")
-            
+
+        # Stash for _get_mesh_metadata so the volume isn't recomputed
+        mesh.metadata["signed_volume"] = volume
+
+        return mesh
+
     except Exception as e:
         if isinstance(e, GeometryError):
             raise e
         logger.warning(f"Mesh validation warning: {e}")
+        return None
+
+
+# Mesh post-processing is CPU-bound numpy plus pure-Python trimesh code
+# that holds the GIL, so it runs in worker processes instead of on the
+# event loop. Workers are forked lazily on first use.
+_MESH_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+# Binary STL record layout: one 50-byte record per triangle. Reading
+# through this dtype gives column views (n/v0/v1/v2) without trimesh's
+# float64 triangle copy - half the bytes per pass on a bandwidth-bound
+# routine.
+STL_DTYPE = np.dtype([('n', '<f4', 3), ('v0', '<f4', 3), ('v1', '<f4', 3),
+                      ('v2', '<f4', 3), ('attr', '<u2')])
+
+
+def _stl_metadata(stl_path: str) -> Optional[dict]:
+    """
+    Volume and bbox straight from the binary STL record array.
+
+    Operates column-wise on the float32 vertex fields; the signed-tet
+    reduction accumulates in float64. Returns None for ASCII or truncated
+    files so the caller can fall back to the trimesh-derived numbers.
+    """
+    try:
+        size = os.path.getsize(stl_path)
+        with open(stl_path, 'rb') as f:
+            header = f.read(84)
+        if len(header) < 84:
+            return None
+        ntri = int(np.frombuffer(header[80:84], dtype='<u4')[0])
+        if ntri == 0 or size != 84 + 50 * ntri:
+            return None  # ASCII or truncated
+        arr = np.fromfile(stl_path, dtype=STL_DTYPE, offset=84)
+        v0, v1, v2 = arr['v0'], arr['v1'], arr['v2']
+        volume = float(np.einsum('ij,ij->i', v0, np.cross(v1, v2),
+                                 dtype=np.float64).sum()) / 6.0
+        lo = np.minimum(np.minimum(v0.min(0), v1.min(0)), v2.min(0))
+        hi = np.maximum(np.maximum(v0.max(0), v1.max(0)), v2.max(0))
+        return {
+            "volume": round(volume, 2),
+            "bbox": np.stack([lo, hi]).astype(float).tolist()
+        }
+    except Exception as e:
+        logger.warning(f"Direct STL metadata read failed: {e}")
+        return None
+
+
+def _validate_and_meta(stl_path: str) -> dict:
+    """
+    Worker-side entry point: parse, validate and measure the STL in one go.
+
+    Runs inside _MESH_POOL so only the small metadata dict crosses the
+    process boundary, never the mesh itself. GeometryError pickles cleanly
+    and re-raises in the awaiting request handler. Metadata comes from the
+    structured-dtype reader when the file is binary STL; the trimesh path
+    covers everything else.
+    """
+    mesh = validate_mesh(stl_path)
+    meta = _stl_metadata(stl_path)
+    if meta is None:
+        meta = _get_mesh_metadata(mesh)
+    return meta
 
 
-def _get_mesh_metadata(stl_path: str) -> dict:
+def _get_mesh_metadata(mesh: Optional["trimesh.Trimesh"]) -> dict:
     """
     Extracts geometric metadata for client-side verification.
-    
-    Returns volume and bounding box to help users validate generated geometry
-    matches their expectations before downloading.
+
+    Takes the already-parsed mesh from validate_mesh. Returns volume and
+    bounding box to help users validate generated geometry matches their
+    expectations before downloading.
     """
-    if not os.path.exists(stl_path):
+    if mesh is None:
         return {}
-    
+
     try:
-        mesh = trimesh.load(stl_path, force='mesh')
-        bbox = mesh.bounds.tolist()  # [[min_x, min_y, min_z], [max_x, max_y, max_z]]
+        verts = mesh.vertices
+        # [[min_x, min_y, min_z], [max_x, max_y, max_z]]
+        bbox = np.stack([verts.min(axis=0), verts.max(axis=0)]).tolist()
+        volume = mesh.metadata.get("signed_volume")
+        if volume is None:
+            volume = mesh.volume
         return {
-            "volume": round(mesh.volume, 2),
+            "volume": round(volume, 2),
             "bbox": bbox
         }
     except Exception as e:
@@ -174,6 +376,194 @@ def _get_mesh_metadata(stl_path: str) -> dict:
 # Docker Execution Sandbox
 # ============================================================================
 
+class _ContainerPool:
+    """
+    Pool of long-running sandbox containers, up to DOCKER_POOL_SIZE per
+    library path.
+
+    Each container is started once with the same hardening as the one-shot
+    path (no network, CPU/memory limits, non-root, read-only root) plus the
+    jobs directory bound at /jobs; scripts then dispatch via `docker exec`,
+    which has near-zero per-call overhead. Jobs rotate round-robin across
+    the pool so concurrent requests don't contend for one container's CPU
+    quota. Containers idle on `sleep infinity` between jobs and are removed
+    on application shutdown.
+    """
+
+    def __init__(self, size: int = 1):
+        self._size = max(size, 1)
+        self._containers: dict[Path, list] = {}
+        self._next: dict[Path, int] = {}
+        self._inflight: dict[str, int] = {}
+        self._lock = asyncio.Lock()
+
+    async def _start_one(self, lib_path: Path) -> Optional[str]:
+        cmd = [
+            "docker", "run", "-d",
+            "--network", "none",
+            "--cpus", "2.0",
+            "--memory", "2048m",
+            "--user", "1000:1000",
+            "--read-only",
+            "--tmpfs", "/tmp:rw,size=512m",
+            "-v", f"{TEMP_DIR}:/jobs:rw",
+            "-v", f"{lib_path.absolute()}:/app/lib:ro",
+            "--entrypoint", "sleep",
+            DOCKER_RUNNER_IMAGE,
+            "infinity"
+        ]
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate()
+        if process.returncode != 0:
+            logger.warning(f"Container pool start failed: {stderr.decode().strip()}")
+            return None
+        cid = stdout.decode().strip()
+        logger.info(f"Started pooled sandbox container {cid[:12]} for {lib_path}")
+        return cid
+
+    async def get(self, lib_path: Path) -> Optional[str]:
+        """Returns a running container ID for lib_path, starting one if needed.
+
+        Every get() must be paired with a release(); with SANDBOX_MAX_INFLIGHT
+        above the pool size, round-robin routinely co-schedules jobs on one
+        container, so pause/unpause is driven by the per-container in-flight
+        count rather than by individual jobs. Both docker calls happen under
+        the pool lock so a pause can never interleave with another job's
+        checkout of the same container.
+        """
+        async with self._lock:
+            cids = self._containers.setdefault(lib_path, [])
+            if len(cids) < self._size:
+                cid = await self._start_one(lib_path)
+                if cid:
+                    cids.append(cid)
+                elif not cids:
+                    return None
+            i = self._next.get(lib_path, 0)
+            self._next[lib_path] = i + 1
+            cid = cids[i % len(cids)]
+            n = self._inflight.get(cid, 0)
+            self._inflight[cid] = n + 1
+            if n == 0 and CONTAINER_REUSE_STRATEGY == "pause":
+                # Wake the paused worker; failure just means it was never
+                # paused (fresh start, or gone - exec recovers downstream)
+                await _docker_quiet("unpause", cid)
+            return cid
+
+    async def release(self, cid: str) -> None:
+        """Marks one in-flight job done; pauses the container once idle."""
+        async with self._lock:
+            n = self._inflight.get(cid, 1) - 1
+            if n > 0:
+                self._inflight[cid] = n
+                return
+            self._inflight.pop(cid, None)
+            if CONTAINER_REUSE_STRATEGY == "pause" and any(
+                    cid in pool for pool in self._containers.values()):
+                await _docker_quiet("pause", cid)
+
+    async def warm(self, lib_path: Path) -> None:
+        """Pre-starts the full pool so the first requests skip cold start."""
+        async with self._lock:
+            cids = self._containers.setdefault(lib_path, [])
+            while len(cids) < self._size:
+                cid = await self._start_one(lib_path)
+                if cid is None:
+                    break  # docker unavailable; requests will retry lazily
+                cids.append(cid)
+
+    async def invalidate(self, lib_path: Path, cid: Optional[str] = None) -> None:
+        """Drops one container (or all for lib_path) after a failed exec."""
+        async with self._lock:
+            cids = self._containers.get(lib_path, [])
+            stale = [cid] if cid and cid in cids else (list(cids) if cid is None else [])
+            for c in stale:
+                cids.remove(c)
+        for c in stale:
+            process = await asyncio.create_subprocess_exec(
+                "docker", "rm", "-f", c,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            await process.wait()
+
+    async def shutdown(self) -> None:
+        """Removes all pooled containers."""
+        async with self._lock:
+            cids = [c for pool in self._containers.values() for c in pool]
+            self._containers.clear()
+            self._inflight.clear()
+        for cid in cids:
+            process = await asyncio.create_subprocess_exec(
+                "docker", "rm", "-f", cid,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            await process.wait()
+
+
+_container_pool = _ContainerPool(DOCKER_POOL_SIZE)
+_docker_api = None  # lazily constructed aiodocker client
+
+
+async def _docker_quiet(*args: str) -> int:
+    """Runs a docker CLI command discarding output; returns the exit code."""
+    process = await asyncio.create_subprocess_exec(
+        "docker", *args,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL
+    )
+    return await process.wait()
+
+
+@app.on_event("startup")
+async def _warm_container_pool():
+    """Pays container cold-start at boot instead of on the first requests."""
+    if DOCKER_POOL:
+        await _container_pool.warm(Path(__file__).parent / "lib")
+
+
+async def _exec_over_socket(cid: str, cmd: list, env: list, workdir: str) -> tuple[str, str, int]:
+    """
+    Runs a command in a pooled container via the Docker HTTP API.
+
+    One persistent client over /var/run/docker.sock replaces a docker CLI
+    fork/exec per job — sub-millisecond syscalls instead of tens of ms of
+    subprocess spin-up. Returns (stdout, stderr, exit_code).
+    """
+    global _docker_api
+    if _docker_api is None:
+        _docker_api = aiodocker.Docker()
+
+    container = _docker_api.containers.container(cid)
+    exec_ = await container.exec(cmd=cmd, environment=env, workdir=workdir,
+                                 stdout=True, stderr=True)
+    out_chunks, err_chunks = [], []
+    async with exec_.start(detach=False) as stream:
+        while True:
+            msg = await stream.read_out()
+            if msg is None:
+                break
+            (out_chunks if msg.stream == 1 else err_chunks).append(msg.data)
+
+    info = await exec_.inspect()
+    rc = info.get("ExitCode")
+    return (b"".join(out_chunks).decode(), b"".join(err_chunks).decode(),
+            rc if rc is not None else 1)
+
+
+@app.on_event("shutdown")
+async def _shutdown_container_pool():
+    await _container_pool.shutdown()
+    if _docker_api is not None:
+        await _docker_api.close()
+    _MESH_POOL.shutdown(wait=False)
+
+
 async def _run_docker_execution(
     script_content: str,
     timeout: int = 30,
@@ -205,14 +595,81 @@ async def _run_docker_execution(
     work_dir.mkdir(parents=True, exist_ok=True)
     
     script_path = work_dir / "gen.py"
-    with open(script_path, "w") as f:
-        f.write(script_content)
+    # Unbuffered one-shot write: scripts are small, so the open() context
+    # and its default buffering are pure overhead on the request path.
+    # 0o644 so the non-root sandbox user can read it through the bind mount.
+    fd = os.open(str(script_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, script_content.encode())
+    finally:
+        os.close(fd)
     
     # Resolve library path - use provided path or default to ./lib relative to script
     if lib_path is None:
         # Default to lib/ directory relative to this file
         lib_path = Path(__file__).parent / "lib"
-    
+
+    # Fast path: dispatch into a pooled container via `docker exec`, skipping
+    # container creation entirely. TEMP_DIR is bound at /jobs in the pooled
+    # container, so the job directory is already visible inside it.
+    if CONTAINER_REUSE_STRATEGY != "none":
+        cid = await _container_pool.get(lib_path)
+        if cid:
+            job_root = f"/jobs/{job_id}"
+            tmp_root = f"/tmp/{job_id}"
+            # Exports land on the container tmpfs (memory-bandwidth only),
+            # then hop to the bind mount with one sequential cp after the
+            # script exits - keeps disk I/O out of the tessellation loop
+            run_script = (
+                f"mkdir -p {tmp_root} && python3 {job_root}/gen.py; rc=$?; "
+                f"cp -f {tmp_root}/output.step {tmp_root}/output.stl {job_root}/ 2>/dev/null; "
+                f"rm -rf {tmp_root}; exit $rc"
+            )
+            # In-container timeout: killing the exec client would leave the
+            # script running inside the pooled container
+            exec_cmd = ["timeout", str(timeout), "sh", "-c", run_script]
+            exec_env = [f"STEP_OUTPUT={tmp_root}/output.step",
+                        f"STL_OUTPUT={tmp_root}/output.stl"]
+            try:
+                if aiodocker is not None:
+                    out, err, returncode = await asyncio.wait_for(
+                        _exec_over_socket(cid, exec_cmd, exec_env, job_root),
+                        timeout=timeout + 5
+                    )
+                else:
+                    cmd = ["docker", "exec", "-w", job_root,
+                           "-e", exec_env[0], "-e", exec_env[1],
+                           cid, *exec_cmd]
+                    process = await asyncio.create_subprocess_exec(
+                        *cmd,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE
+                    )
+                    stdout, stderr = await asyncio.wait_for(
+                        process.communicate(),
+                        timeout=timeout + 5
+                    )
+                    out, err, returncode = stdout.decode(), stderr.decode(), process.returncode
+                if returncode in (126, 127):
+                    # Container died or exec could not start - rebuild the
+                    # pool entry and fall through to the one-shot path
+                    logger.warning("Pooled container exec failed; falling back to docker run")
+                    await _container_pool.invalidate(lib_path, cid)
+                elif returncode == 124:
+                    logger.warning(f"Execution timeout after {timeout}s")
+                    return "", f"TIMEOUT: Execution exceeded {timeout}s limit", 124, work_dir
+                else:
+                    return out, err, returncode, work_dir
+            except asyncio.TimeoutError:
+                logger.warning(f"Execution timeout after {timeout}s")
+                await _container_pool.invalidate(lib_path, cid)
+                return "", f"TIMEOUT: Execution exceeded {timeout}s limit", 124, work_dir
+            except Exception as e:
+                logger.warning(f"Pooled execution error, falling back to docker run: {e}")
+                await _container_pool.invalidate(lib_path, cid)
+            finally:
+                await _container_pool.release(cid)
+
     # Security-hardened Docker command with defense-in-depth:
     # - Network isolation prevents code injection attacks (user-generated Python
     #   cannot exfiltrate data or access internal services)
@@ -229,11 +686,16 @@ async def _run_docker_execution(
         "--tmpfs", "/tmp:rw,size=512m",  # Writable /tmp (Increased for large temp files)
         "-v", f"{work_dir}:/workspace:rw",  # Workspace for I/O
         "-w", "/workspace",
-        "-e", "STEP_OUTPUT=/workspace/output.step",
-        "-e", "STL_OUTPUT=/workspace/output.stl",
+        # Exports write to tmpfs first, then one sequential cp to the bind
+        # mount (see the pooled path above)
+        "-e", "STEP_OUTPUT=/tmp/out/output.step",
+        "-e", "STL_OUTPUT=/tmp/out/output.stl",
         "-v", f"{lib_path.absolute()}:/app/lib:ro",  # Read-only library mount
+        "--entrypoint", "sh",
         DOCKER_RUNNER_IMAGE,
-        "/workspace/gen.py"
+        "-c",
+        "mkdir -p /tmp/out && python3 /workspace/gen.py; rc=$?; "
+        "cp -f /tmp/out/output.step /tmp/out/output.stl /workspace/ 2>/dev/null; exit $rc"
     ]
     
     try:
@@ -268,6 +730,156 @@ class RenderRequest(BaseModel):
     gemini_api_key: Optional[str] = None  # Not used for rendering, kept for API consistency
 
 
+# ============================================================================
+# Response Cache
+# ============================================================================
+
+@dataclass
+class UploadDigest:
+    """
+    A spooled upload, hashed once and stored content-addressed.
+
+    Quacks enough like UploadFile for the pipeline (read/seek/content_type)
+    while exposing the digest that feeds the response-cache key.
+    """
+    path: Path
+    digest: str
+    content_type: Optional[str]
+
+    async def read(self) -> bytes:
+        return self.path.read_bytes()
+
+    async def seek(self, offset: int) -> None:
+        # Each read() starts from the stored file, nothing to rewind
+        pass
+
+
+async def _digest_uploads(files: List[UploadFile]) -> List[UploadDigest]:
+    """
+    Streams each upload into the content-addressed store.
+
+    Hashes 64 KiB chunks with blake2b while spooling to disk, then renames
+    the spool to <UPLOAD_STORE_DIR>/<digest>; identical files across
+    requests land on the same path and the second write is dropped.
+    """
+    out = []
+    UPLOAD_STORE_DIR.mkdir(parents=True, exist_ok=True)
+    for f in files:
+        h = hashlib.blake2b(digest_size=32)
+        spool = UPLOAD_STORE_DIR / f".spool_{uuid.uuid4().hex}"
+        with open(spool, "wb") as dst:
+            while True:
+                chunk = await f.read(65536)
+                if not chunk:
+                    break
+                h.update(chunk)
+                dst.write(chunk)
+        digest = h.hexdigest()
+        stored = UPLOAD_STORE_DIR / digest
+        if stored.exists():
+            spool.unlink()  # dedupe: same content already stored
+        else:
+            spool.rename(stored)
+        out.append(UploadDigest(path=stored, digest=digest,
+                                content_type=f.content_type))
+    return out
+
+
+def _response_cache_key(
+    prompt: str,
+    fmt: str,
+    previous_code: Optional[str],
+    constraints: Optional[str],
+    files: List[UploadDigest]
+) -> Optional[str]:
+    """
+    Derives the exact-match cache key for a /generate request.
+
+    Hashes every input that influences the generated artifact: the prompt,
+    output format, iterative previous_code, constraint JSON and the content
+    digest of each uploaded reference file. Returns None when caching is
+    disabled.
+    """
+    if not RESPONSE_CACHE:
+        return None
+
+    h = hashlib.sha256()
+    for part in (prompt, fmt, previous_code or "", constraints or ""):
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")
+
+    for f in files:
+        h.update(f.digest.encode("ascii"))
+
+    return h.hexdigest()
+
+
+def _response_cache_get(key: str) -> Optional[FileResponse]:
+    """
+    Returns the stored response for a cache key, or None on miss.
+
+    A hit re-serves the artifact straight from disk with the original
+    metadata headers plus X-Cache: hit — no LLM calls, no sandbox.
+    """
+    entry_dir = RESPONSE_CACHE_DIR / key
+    meta_path = entry_dir / "meta.json"
+    artifact_path = entry_dir / "artifact.bin"
+
+    try:
+        meta = _json_loads(meta_path.read_text())
+    except (OSError, ValueError):
+        return None
+
+    if not artifact_path.exists():
+        return None
+
+    headers = dict(meta.get("headers", {}))
+    headers["X-Cache"] = "hit"
+
+    logger.info(f"Response cache hit: {key[:12]}")
+    return FileResponse(
+        path=artifact_path,
+        filename=meta["filename"],
+        media_type=meta["media_type"],
+        headers=headers
+    )
+
+
+def _response_cache_store(
+    key: str,
+    source,
+    filename: str,
+    media_type: str,
+    headers: dict
+) -> None:
+    """
+    Persists a successful generation under cache/<hash>/.
+
+    source is the artifact as a Path or a seekable binary file object
+    (the streamed-zip branch hands over its spooled buffer). Only called
+    after sandbox execution and mesh validation succeed, so failed
+    attempts are never replayed. Best-effort: a full disk or permission
+    error degrades to a cache miss, never a failed request.
+    """
+    try:
+        entry_dir = RESPONSE_CACHE_DIR / key
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        if hasattr(source, "read"):
+            source.seek(0)
+            with open(entry_dir / "artifact.bin", "wb") as dst:
+                shutil.copyfileobj(source, dst)
+        else:
+            shutil.copyfile(source, entry_dir / "artifact.bin")
+        meta = {
+            "filename": filename,
+            "media_type": media_type,
+            "headers": headers,
+        }
+        (entry_dir / "meta.json").write_text(_json_dumps(meta))
+    except Exception as e:
+        logger.warning(f"Response cache store failed for {key[:12]}: {e}")
+
+
 # ============================================================================
 # API Endpoints
 # ============================================================================
@@ -319,12 +931,9 @@ async def generate_from_text(
             detail="gemini_api_key is required in request body"
         )
     
-    # Initialize pipeline with user-provided API key
+    # Initialize (or reuse) the pipeline for the user-provided API key
     try:
-        agent_pipeline = AgentPipeline(
-            api_key=gemini_api_key,
-            model_name=GEMINI_MODEL
-        )
+        agent_pipeline = _get_pipeline(gemini_api_key, GEMINI_MODEL)
     except Exception as e:
         logger.error(f"Failed to initialize pipeline: {e}")
         raise HTTPException(
@@ -335,49 +944,88 @@ async def generate_from_text(
     current_prompt = prompt
     last_error = None
     feedback_msg = None
-    file_list = files if files else []
-    
+
+    # Hash uploads once into the content-addressed store; the digests feed
+    # the cache key and the stored files back the pipeline's reads
+    file_list = await _digest_uploads(files) if files else []
+
+    # Exact-match response cache: identical requests skip Gemini and Docker
+    cache_key = _response_cache_key(
+        prompt, format, previous_code, constraints, file_list
+    )
+    if cache_key:
+        cached = _response_cache_get(cache_key)
+        if cached:
+            return cached
+
+    # Parse constraints once; the input is immutable across retries
+    constraint_dict = None
+    if constraints:
+        try:
+            constraint_dict = _json_loads(constraints)
+        except ValueError:
+            logger.warning(f"Invalid constraints JSON: {constraints}")
+
+    # Spec compaction memo: retries usually extract an identical spec
+    # (same prompt, same model), so skip the re-parse when the text matches
+    last_spec = None
+    compact_spec = None
+
     # Retry loop with error feedback (max 3 attempts)
     for attempt in range(3):
         try:
             logger.info(f"Generation attempt {attempt + 1}/3")
             if feedback_msg:
                 logger.info(f"Retrying with feedback: {feedback_msg}")
-            
-            # Parse constraints if provided
-            constraint_dict = None
-            if constraints:
-                try:
-                    constraint_dict = json.loads(constraints)
-                except json.JSONDecodeError:
-                    logger.warning(f"Invalid constraints JSON: {constraints}")
-            
+
             # Use previous_code for iterative design, otherwise use error feedback
             feedback = previous_code if previous_code and attempt == 0 else feedback_msg
             
-            # Run pipeline: spec extraction → code generation
-            fc_result = await agent_pipeline.run(
-                current_prompt,
-                files=file_list,
-                feedback=feedback,
-                constraints=constraint_dict
-            )
-            
+            # Run pipeline: spec extraction → code generation. Quota errors
+            # get their own jittered backoff so they never consume the
+            # geometry retry budget.
+            for quota_attempt in range(4):
+                try:
+                    async with _gemini_limiter:
+                        fc_result = await agent_pipeline.run(
+                            current_prompt,
+                            files=file_list,
+                            feedback=feedback,
+                            constraints=constraint_dict
+                        )
+                    break
+                except ResourceExhausted:
+                    if quota_attempt == 3:
+                        raise HTTPException(
+                            status_code=429,
+                            detail="Gemini quota exhausted, retry later"
+                        )
+                    delay = 2 ** quota_attempt + random.uniform(0, 1)
+                    logger.warning(
+                        f"Gemini quota hit, backing off {delay:.1f}s "
+                        f"(attempt {quota_attempt + 1}/4)"
+                    )
+                    await asyncio.sleep(delay)
+
+
             fc_code = fc_result["fc_code"]
             extracted_spec = fc_result["spec"]
             usage = fc_result["usage"]
             timings = fc_result.get("timings", {})
             
-            # Prepare response headers with metadata
-            # Compact spec for header (no newlines)
-            try:
-                compact_spec = json.dumps(json.loads(extracted_spec))
-            except json.JSONDecodeError:
-                compact_spec = extracted_spec.replace("\n", " ")
+            # Compact spec for header (no newlines). The pipeline emits the
+            # spec via JSON-mode decoding, so it always parses. json.dumps
+            # rather than _json_dumps: headers are latin-1 on the wire, so
+            # the value needs ensure_ascii escaping (orjson emits raw UTF-8).
+            if extracted_spec != last_spec:
+                compact_spec = json.dumps(_json_loads(extracted_spec),
+                                          separators=(",", ":"))
+                last_spec = extracted_spec
             
             headers = {
                 "X-Input-Tokens": str(usage.get("input_tokens", 0)),
                 "X-Output-Tokens": str(usage.get("output_tokens", 0)),
+                "X-Cached-Input-Tokens": str(usage.get("cached_input_tokens", 0)),
                 "X-Extracted-Constraints": compact_spec,
                 "X-Duration-Spec": f"{timings.get('spec', 0):.4f}",
                 "X-Duration-Code": f"{timings.get('code', 0):.4f}"
@@ -390,7 +1038,8 @@ async def generate_from_text(
                 fc_code,
                 background_tasks,
                 extra_headers=headers,
-                fmt=format
+                fmt=format,
+                cache_key=cache_key
             )
             
         except GeometryError as e:
@@ -444,11 +1093,83 @@ async def render_from_script(
 # FreeCAD Generation Pipeline
 # ============================================================================
 
+async def _enqueue_or_reject() -> None:
+    """
+    Takes a sandbox slot or fails fast with 503 when saturated.
+
+    Rejection at entry keeps tail latency bounded under bursts - a request
+    that would only queue behind SANDBOX_MAX_INFLIGHT others is cheaper to
+    retry client-side than to hold open. The rejection count is logged for
+    scrape-based monitoring.
+    """
+    global _sandbox_rejections
+    if _sandbox_slots.locked():
+        _sandbox_rejections += 1
+        logger.warning(
+            f"Sandbox saturated, shedding request "
+            f"(total rejections: {_sandbox_rejections})")
+        raise HTTPException(
+            status_code=503,
+            detail="sandbox saturated, retry with backoff"
+        )
+    await _sandbox_slots.acquire()
+
+
+def _write_stored_zip(dst, members) -> None:
+    """
+    Minimal stored-mode ZIP writer.
+
+    members is a list of (path, arcname) pairs. Each payload gets a chunked
+    zlib.crc32 pass (hardware CRC in zlib) and one shutil.copyfileobj copy,
+    skipping zipfile's per-record object machinery and the compressor - the
+    archive ships stored either way. No zip64: outputs are far below 4 GiB.
+    """
+    now = time.localtime()
+    dos_time = (now.tm_hour << 11) | (now.tm_min << 5) | (now.tm_sec // 2)
+    dos_date = ((now.tm_year - 1980) << 9) | (now.tm_mon << 5) | now.tm_mday
+
+    central = []
+    offset = 0
+    for path, arcname in members:
+        name = arcname.encode("ascii")
+        size = os.path.getsize(path)
+        with open(path, "rb") as src:
+            crc = 0
+            while True:
+                chunk = src.read(1 << 20)
+                if not chunk:
+                    break
+                crc = zlib.crc32(chunk, crc)
+            # Local file header: version 2.0, no flags, method 0 (stored)
+            dst.write(struct.pack(
+                "<4s5H3L2H", b"PK\x03\x04", 20, 0, 0, dos_time, dos_date,
+                crc, size, size, len(name), 0))
+            dst.write(name)
+            src.seek(0)
+            shutil.copyfileobj(src, dst, length=1 << 20)
+        central.append((name, crc, size, offset))
+        offset += 30 + len(name) + size
+
+    cd_start = offset
+    for name, crc, size, local_offset in central:
+        dst.write(struct.pack(
+            "<4s6H3L5H2L", b"PK\x01\x02", 20, 20, 0, 0, dos_time, dos_date,
+            crc, size, size, len(name), 0, 0, 0, 0, 0, local_offset))
+        dst.write(name)
+        offset += 46 + len(name)
+
+    # End of central directory
+    dst.write(struct.pack(
+        "<4s4H2LH", b"PK\x05\x06", 0, 0, len(central), len(central),
+        offset - cd_start, cd_start, 0))
+
+
 async def _run_freecad_generation(
     fc_code: str,
     background_tasks: BackgroundTasks,
     extra_headers: Optional[dict] = None,
-    fmt: str = "stl"
+    fmt: str = "stl",
+    cache_key: Optional[str] = None
 ) -> FileResponse:
     """
     Executes FreeCAD code and packages output for delivery.
@@ -464,14 +1185,19 @@ async def _run_freecad_generation(
         background_tasks: FastAPI background tasks for cleanup
         extra_headers: Additional headers to include in response
         fmt: Output format ('stl', 'step', or 'zip')
+        cache_key: Response-cache key to store this result under, if any
     
     Returns:
         FileResponse with generated model file
     """
     start_time = time.time()
-    
-    # Execute in Docker sandbox
-    stdout, stderr, code, work_dir = await _run_docker_execution(fc_code)
+
+    # Execute in Docker sandbox, shedding load when it is saturated
+    await _enqueue_or_reject()
+    try:
+        stdout, stderr, code, work_dir = await _run_docker_execution(fc_code)
+    finally:
+        _sandbox_slots.release()
     
     step_out = work_dir / "output.step"
     stl_out = work_dir / "output.stl"
@@ -484,76 +1210,109 @@ async def _run_freecad_generation(
             )
             raise GeometryError(f"FreeCAD Error: {stderr}")
         
-        # Validate mesh if STL was generated
+        # Validate mesh if STL was generated. Runs in the worker pool so
+        # large-mesh numpy work doesn't stall the event loop.
         if stl_out.exists():
-            validate_mesh(str(stl_out))
-            mesh_meta = _get_mesh_metadata(str(stl_out))
-            
+            mesh_meta = await asyncio.get_running_loop().run_in_executor(
+                _MESH_POOL, _validate_and_meta, str(stl_out))
+
+
             if mesh_meta and extra_headers is not None:
                 extra_headers["X-Mesh-Volume"] = str(mesh_meta["volume"])
-                extra_headers["X-Mesh-BBox"] = json.dumps(mesh_meta["bbox"])
+                extra_headers["X-Mesh-BBox"] = _json_dumps(mesh_meta["bbox"])
         
+        def cleanup_workdir():
+            """Background task to clean up temporary files."""
+            try:
+                shutil.rmtree(work_dir)
+                logger.debug(f"Cleaned up work directory: {work_dir}")
+            except Exception as e:
+                logger.warning(f"Cleanup failed for {work_dir}: {e}")
+
         # Package output based on format
         if fmt in ["zip", "both"]:
-            zip_path = work_dir / "render.zip"
-            with zipfile.ZipFile(zip_path, 'w') as zf:
-                if step_out.exists():
-                    zf.write(step_out, "render.step")
-                if stl_out.exists():
-                    zf.write(stl_out, "render.stl")
-                if script_path.exists():
-                    zf.write(script_path, "model_gen.py")
-            
-            res_path = zip_path
+            # Stream the archive straight from a spooled buffer rather than
+            # writing render.zip into work_dir and re-reading it. STEP/STL
+            # are low-entropy text, so stored mode skips pointless deflate CPU.
+            spool = tempfile.SpooledTemporaryFile(max_size=16 * 1024 * 1024)
+            _write_stored_zip(spool, [
+                (path, arcname)
+                for path, arcname in ((step_out, "render.step"),
+                                      (stl_out, "render.stl"),
+                                      (script_path, "model_gen.py"))
+                if path.exists()
+            ])
+
             filename = f"render_{work_dir.name}.zip"
-            media_type = "application/zip"
-        else:
-            # Single file output
-            res_path = step_out if (fmt == "step" and step_out.exists()) else stl_out
-            filename = f"render.{fmt}"
-            media_type = "application/octet-stream"
-        
+            headers = {
+                "X-Render-Duration": f"{time.time() - start_time:.4f}",
+                "Content-Disposition": f'attachment; filename="{filename}"'
+            }
+            if extra_headers:
+                headers.update(extra_headers)
+
+            # Persist the successful result so an identical request replays it
+            if cache_key:
+                _response_cache_store(cache_key, spool, filename,
+                                      "application/zip", headers)
+
+            background_tasks.add_task(cleanup_workdir)
+
+            def stream_zip(buf=spool, chunk_size=64 * 1024):
+                buf.seek(0)
+                try:
+                    while True:
+                        data = buf.read(chunk_size)
+                        if not data:
+                            break
+                        yield data
+                finally:
+                    buf.close()
+
+            return StreamingResponse(
+                stream_zip(),
+                media_type="application/zip",
+                headers=headers
+            )
+
+        # Single file output
+        res_path = step_out if (fmt == "step" and step_out.exists()) else stl_out
+        filename = f"render.{fmt}"
+        media_type = "application/octet-stream"
+
         if not res_path.exists():
             raise HTTPException(
                 status_code=500,
                 detail="Output file missing from container"
             )
-        
-        # Calculate render duration
-        render_time = time.time() - start_time
-        
+
         # Build response headers
         headers = {
-            "X-Render-Duration": f"{render_time:.4f}"
+            "X-Render-Duration": f"{time.time() - start_time:.4f}"
         }
-        
+
         if extra_headers:
             headers.update(extra_headers)
-        
-        # Schedule cleanup task (runs after response is sent)
-        import shutil
-        
-        def cleanup_workdir():
-            """Background task to clean up temporary files."""
-            try:
-                shutil.rmtree(work_dir)
-                logger.debug(f"Cleaned up work directory: {work_dir}")
-            except Exception as e:
-                logger.warning(f"Cleanup failed for {work_dir}: {e}")
-        
+
+        # Persist the successful result so an identical request replays it
+        if cache_key:
+            _response_cache_store(cache_key, res_path, filename, media_type, headers)
+
         background_tasks.add_task(cleanup_workdir)
-        
+
         return FileResponse(
             path=res_path,
             filename=filename,
             media_type=media_type,
             headers=headers
         )
-        
+
     except Exception as e:
-        # Ensure cleanup on failure
-        import shutil
-        shutil.rmtree(work_dir, ignore_errors=True)
+        # Ensure cleanup on failure without blocking the error response on a
+        # walk over the work dir. BackgroundTasks don't run when the handler
+        # raises, so hand the rmtree to the loop's thread pool instead.
+        asyncio.create_task(
+            asyncio.to_thread(shutil.rmtree, work_dir, ignore_errors=True))
         
         if isinstance(e, (GeometryError, HTTPException)):
             raise e
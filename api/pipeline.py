@@ -1,8 +1,13 @@
 import os
 import json
 import base64
+import asyncio
+import datetime
+import functools
 import logging
+import re
 import time
+from pathlib import Path
 from typing import Optional, Dict, Any, List
 import google.generativeai as genai
 import trimesh
@@ -41,8 +46,7 @@ def generate_model(utils, step_path, stl_path):
     positions = [(-42.5, -27.5), (42.5, -27.5), (-42.5, 27.5), (42.5, 27.5)]
     body = utils.add_enclosure_bosses(body, positions, boss_dia=7, boss_height=6, floor_z=floor_z)
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
 ```
 
 ## EXAMPLE 2: L-Bracket
@@ -57,8 +61,7 @@ def generate_model(utils, step_path, stl_path):
         hole_dia=5, hole_positions=[(1, 25), (2, 20)], fillet_radius=3
     )
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
 ```
 
 ## EXAMPLE 3: Custom block with holes and pocket
@@ -80,8 +83,7 @@ def generate_model(utils, step_path, stl_path):
                                   position=Base.Vector(0, 0, H/2-10))
     body = utils.cut_objects(body, pocket)
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
 ```
 
 ## EXAMPLE 4: Pipe Flange
@@ -97,8 +99,7 @@ def generate_model(utils, step_path, stl_path):
         hub_dia=115, hub_height=10
     )
     
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
+    utils.export_both(body, step_path, stl_path)
 ```
 """
 
@@ -156,6 +157,26 @@ SPEC_TYPE_EXAMPLES = {
     "wedge": ["example_wedge.py"],
 }
 
+# Keyword matching runs on every request (example selection and the
+# speculation-safety check), so the K-substring scan over the spec is
+# replaced by one linear pass: an Aho-Corasick automaton when
+# pyahocorasick is installed, otherwise a compiled alternation wrapped
+# in a lookahead so overlapping keywords (e.g. "bracket" inside
+# "l-bracket") still all match, as the substring loop did.
+try:
+    import ahocorasick
+
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _kw, _files in SPEC_TYPE_EXAMPLES.items():
+        _KEYWORD_AUTOMATON.add_word(_kw, _files)
+    _KEYWORD_AUTOMATON.make_automaton()
+    _KEYWORD_RE = None
+except ImportError:
+    _KEYWORD_AUTOMATON = None
+    _KEYWORD_RE = re.compile(
+        r"(?=(" + "|".join(sorted(map(re.escape, SPEC_TYPE_EXAMPLES),
+                                  key=len, reverse=True)) + r"))")
+
 UTILS_QUICK_REF = """
 ## PartUtils Quick Reference
 
@@ -234,6 +255,7 @@ copy_object(obj, new_name=None)
 center_object(obj, axes="XYZ")
 
 ### EXPORT
+export_both(obj, step_path, stl_path)  ← preferred: runs both in parallel
 export_step(obj, path)
 export_stl(obj, path)
 
@@ -246,51 +268,261 @@ revolve_profile(name, sketch, axis_dir, angle)
 loft_profiles(name, list_of_sketches)
 """
 
+# Static part of the code-gen prompt: identical on every request, so it can
+# live in a Gemini context cache instead of being re-tokenized each call.
+# Type-specific examples are dynamic and travel in the user message.
+CODEGEN_SYSTEM_PROMPT = f"""You are an Expert FreeCAD Code Generator.
+
+{UTILS_QUICK_REF}
+
+{FEW_SHOT_EXAMPLES}
+
+OUTPUT FORMAT:
+```python
+def generate_model(utils, step_path, stl_path):
+    from FreeCAD import Base
+
+    # Your code here
+
+    utils.export_both(body, step_path, stl_path)
+```
+
+CRITICAL RULES:
+
+1. USE MEGA-FUNCTIONS when available:
+   - Enclosures: `body, floor_z = utils.create_enclosure_base(...)`
+   - Brackets: `body = utils.create_l_bracket(...)`
+   - Flanges: `body = utils.create_pipe_flange(...)`
+
+2. COORDINATE CONVERSION:
+   If spec positions are from corner (e.g., X=12.5 on 110mm part):
+   `centered_x = corner_x - length/2  # 12.5 - 55 = -42.5`
+
+3. DRAFT BEFORE FILLETS (mandatory for enclosures):
+   The mega-function handles this internally. Don't add extra draft calls.
+
+4. BOSS POSITIONS use centered coordinates:
+   `positions = [(-42.5, -27.5), (42.5, -27.5), (-42.5, 27.5), (42.5, 27.5)]`
+
+5. ALWAYS use position= parameter:
+   `utils.create_cylinder("hole", r, h, position=Base.Vector(x, y, z))`
+
+6. KEEP CODE SHORT - mega-functions do the heavy lifting.
+   Typical enclosure: 15-20 lines
+   Typical bracket: 5-10 lines
+   Typical flange: 5-10 lines
+
+7. END WITH EXPORTS:
+   ```python
+   utils.export_both(body, step_path, stl_path)
+   ```
+"""
+
+# Server-side prompt cache lifetime. The local handle is refreshed a minute
+# early so a request never races the server dropping the cache.
+CONTEXT_CACHE_TTL_SECONDS = 3600
+
+# Dispatch table for retry feedback, evaluated top-down against the
+# lowered error line - first rule whose pattern matches wins, so the
+# tuple order IS the old if-chain's priority. Each rule is searched
+# independently: a merged alternation would let a greedy span like
+# "fillet.*too large" swallow a higher-priority token sitting inside it.
+# Messages are format strings; {line} interpolates the matched error line.
+_ERR_RULES = tuple((re.compile(pattern), message) for pattern, message in (
+    (r"apply_draft failed|draft.*before|before.*draft",
+     "DRAFT FAILED: You must apply draft BEFORE any fillets. Reorder: box → draft → fillet → shell"),
+    (r"null shape",
+     "NULL SHAPE: Boolean operation failed. Ensure objects overlap and have valid geometry."),
+    (r"fuse_objects failed",
+     "FUSION FAILED: Objects DO NOT intersect. Move objects closer (overlap by at least 0.1mm) or check dimensions."),
+    (r"fillet.*too large|too large.*fillet",
+     "FILLET ERROR: {line}. Reduce fillet radius."),
+    (r"not watertight",
+     "NON-MANIFOLD: Mesh has holes. Check boolean operations created valid solids."),
+    (r"empty",
+     "EMPTY RESULT: No geometry created. Verify your logic creates actual shapes."),
+    (r"makefillet",
+     "FILLET FAILED: Radius may be too large for edge length, or edge selection returned nothing."),
+))
+
+# System prompt for the spec-extraction model, constructed once per
+# pipeline instance rather than per call.
+_SPEC_SYSTEM = """You are a CAD Specification Extractor. Output JSON ONLY.
+
+Required fields:
+{
+  "type": "enclosure|bracket|flange|gear|shaft|housing|custom",
+  "dimensions": { ... all measurements in mm ... },
+  "features": [ { "type": "...", "params": {...} }, ... ],
+  "constraints": { "param_name": numeric_value, ... },
+  "coordinate_system": "corner|center"  // Are positions from corner (0,0) or center?
+}
+
+CRITICAL EXTRACTIONS:
+- For enclosures: wall_thickness vs floor_thickness (may differ!)
+- For brackets: leg lengths, hole positions, fillet radii
+- For flanges: bolt circle diameter, bolt count, bore size
+- For gears: module, tooth count, bore, hub dimensions
+- Position references: note if dimensions are from corner or center origin
+- AMBIGUOUS POSITIONS: If a position is described as "adjacent" or "next to" without coordinates,
+  calculate absolute positions based on object dimensions. Never leave positions undefined.
+
+Focus on GEOMETRY only. Ignore materials, colors, finishes."""
+
+# Vague position words the spec extractor is told to resolve; any that
+# slip through get pinned to the origin.
+_AMBIG_RE = re.compile(r"adjacent|next to|beside|near", re.IGNORECASE)
+
+# Sandbox-escape patterns blocked before generated code reaches the
+# execution container - compiled once, scanned in a single pass.
+_DANGER_RE = re.compile(
+    r"subprocess|os\.system|eval\(|exec\(|__import__|os\.popen")
+
+def _preload_examples() -> dict:
+    """
+    Slurps every referenced example file into RAM at import.
+
+    lib/examples/ is static and small, so the per-request open/read
+    syscalls become dict lookups. Each entry is stored pre-formatted as
+    its markdown block, leaving pure string joins on the hot path.
+    """
+    cache = {}
+    for filename in sorted(set().union(*SPEC_TYPE_EXAMPLES.values())):
+        try:
+            content = Path(EXAMPLES_DIR, filename).read_text()
+            cache[filename] = f"\n### {filename}\n```python\n{content}\n```\n"
+        except Exception as e:
+            logger.warning(f"Could not load example {filename}: {e}")
+    return cache
+
+
+_EXAMPLES_CACHE = _preload_examples()
+
+
+@functools.lru_cache(maxsize=128)
+def _matched_example_files(text: str) -> frozenset:
+    """
+    Example files whose trigger keywords appear in the text.
+
+    Module-level and memoized: within one request the same prompt and spec
+    strings are scanned several times (speculation safety, acceptance
+    comparison, example selection), so repeats skip both the full-copy
+    lower() and the keyword pass.
+    """
+    text_lower = text.lower()
+    # dict-keyed dedupe: cheaper than a set at these sizes (typically well
+    # under 10 entries) and keeps insertion order for anyone iterating it
+    matched: dict = {}
+    if _KEYWORD_AUTOMATON is not None:
+        for _, files in _KEYWORD_AUTOMATON.iter(text_lower):
+            matched.update(dict.fromkeys(files))
+    else:
+        for m in _KEYWORD_RE.finditer(text_lower):
+            matched.update(dict.fromkeys(SPEC_TYPE_EXAMPLES[m.group(1)]))
+    return frozenset(matched)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_examples_bundle(filenames: frozenset) -> str:
+    """
+    Formatted markdown block for a set of example files.
+
+    Memoized on the filename set - there are only ~30 distinct bundles.
+    Blocks come pre-formatted from _EXAMPLES_CACHE; files that failed to
+    preload are skipped.
+    """
+    blocks = [_EXAMPLES_CACHE[name] for name in sorted(filenames)
+              if name in _EXAMPLES_CACHE]
+    if not blocks:
+        return ""
+
+    logger.info(f"Injected {len(blocks)} type-specific examples")
+    return "\n## RELEVANT EXAMPLES FOR YOUR SPEC:\n" + "".join(blocks)
+
+# genai credentials are module-global; track the active key so pipeline
+# instances cached across requests (one per API key) can cheaply restore
+# theirs before issuing calls.
+_configured_key = None
+
+
+def _ensure_configured(api_key: str) -> None:
+    global _configured_key
+    if api_key != _configured_key:
+        genai.configure(api_key=api_key)
+        _configured_key = api_key
+
 
 class AgentPipeline:
     def __init__(self, api_key: str, model_name: str, utils_lib_path: str = "lib/freecad_utils.py"):
         if not api_key:
             raise ValueError("Google API Key required")
-        genai.configure(api_key=api_key)
+        _ensure_configured(api_key)
+        self._api_key = api_key
         self.model = genai.GenerativeModel(model_name)
+        # Spec-extraction model, built once. JSON mode: decoding is
+        # constrained to the JSON grammar, so the response is always
+        # syntactically valid - no markdown fences, no parse-failure
+        # retries. A full response_schema is not used because
+        # dimensions/constraints have open-ended keys that the API's
+        # schema subset cannot express.
+        self._spec_model = genai.GenerativeModel(
+            model_name,
+            system_instruction=_SPEC_SYSTEM,
+            generation_config=genai.GenerationConfig(
+                response_mime_type="application/json"
+            )
+        )
+        # Context cache for CODEGEN_SYSTEM_PROMPT, created lazily on first
+        # use. The caching API enforces a minimum token count and not every
+        # model supports it; when unavailable the prompt simply ships inline
+        # with every request as before.
+        self._codegen_model = None
+        self._cache_expiry = 0.0
+
+    def _get_cached_codegen_model(self):
+        """
+        Returns a model backed by a server-side cache of the static code-gen
+        prompt, or None when context caching is unavailable (callers then
+        send the prompt inline). Recreates the cache lazily once its TTL
+        has passed; a failed create backs off for one TTL instead of
+        retrying on every request.
+        """
+        now = time.time()
+        if self._codegen_model is not None and now < self._cache_expiry:
+            return self._codegen_model
+        try:
+            cache = genai.caching.CachedContent.create(
+                model=self.model.model_name,
+                system_instruction=CODEGEN_SYSTEM_PROMPT,
+                ttl=datetime.timedelta(seconds=CONTEXT_CACHE_TTL_SECONDS),
+            )
+            self._codegen_model = genai.GenerativeModel.from_cached_content(cache)
+            self._cache_expiry = now + CONTEXT_CACHE_TTL_SECONDS - 60
+            logger.info("Context cache created for code-gen prompt")
+        except Exception as e:
+            self._codegen_model = None
+            self._cache_expiry = now + CONTEXT_CACHE_TTL_SECONDS
+            logger.info(f"Context caching unavailable, sending prompt inline: {e}")
+        return self._codegen_model
+
+    def _matched_example_files(self, text: str) -> frozenset:
+        """Example files whose trigger keywords appear in the text."""
+        return _matched_example_files(text)
 
     def _get_relevant_examples(self, spec: str, max_examples: int = 3) -> str:
         """
         Load example files based on keywords found in the spec.
         Returns formatted examples string for system prompt injection.
         """
-        spec_lower = spec.lower()
-        matched_files = set()
-        
-        # Find all matching example files
-        for keyword, files in SPEC_TYPE_EXAMPLES.items():
-            if keyword in spec_lower:
-                matched_files.update(files)
-        
+        matched_files = self._matched_example_files(spec)
+
         if not matched_files:
             logger.info("No type-specific examples matched, using defaults")
             return ""
-        
-        # Load up to max_examples files
-        examples_text = "\n## RELEVANT EXAMPLES FOR YOUR SPEC:\n"
-        loaded = 0
-        
-        for filename in list(matched_files)[:max_examples]:
-            filepath = os.path.join(EXAMPLES_DIR, filename)
-            try:
-                with open(filepath, 'r') as f:
-                    content = f.read()
-                    examples_text += f"\n### {filename}\n```python\n{content}\n```\n"
-                    loaded += 1
-                    logger.info(f"Loaded example: {filename}")
-            except Exception as e:
-                logger.warning(f"Could not load example {filename}: {e}")
-        
-        if loaded == 0:
-            return ""
-        
-        logger.info(f"Injected {loaded} type-specific examples")
-        return examples_text
+
+        # Sorted for a deterministic pick and a stable cache key
+        return _load_examples_bundle(
+            frozenset(sorted(matched_files)[:max_examples]))
 
     def _parse_freecad_error(self, stderr: str) -> str:
         """Parse errors into actionable feedback for retry."""
@@ -302,25 +534,30 @@ class AgentPipeline:
                 error_line = line
         
         s = error_line.lower()
-        
-        if "apply_draft failed" in s or "draft" in s and "before" in s:
-            return "DRAFT FAILED: You must apply draft BEFORE any fillets. Reorder: box → draft → fillet → shell"
-        if "null shape" in s:
-            return "NULL SHAPE: Boolean operation failed. Ensure objects overlap and have valid geometry."
-        if "fuse_objects failed" in s:
-            return "FUSION FAILED: Objects DO NOT intersect. Move objects closer (overlap by at least 0.1mm) or check dimensions."
-        if "fillet" in s and "too large" in s:
-            return f"FILLET ERROR: {s.split('ValueError: ')[-1] if 'ValueError:' in s else s}. Reduce fillet radius."
-        if "not watertight" in s:
-            return "NON-MANIFOLD: Mesh has holes. Check boolean operations created valid solids."
-        if "empty" in s:
-            return "EMPTY RESULT: No geometry created. Verify your logic creates actual shapes."
-        if "makefillet" in s:
-            return "FILLET FAILED: Radius may be too large for edge length, or edge selection returned nothing."
-        
+
+        for rx, message in _ERR_RULES:
+            if rx.search(s):
+                return message.format(line=s)
+
         return f"ERROR: {stderr[:300]}"
 
-    async def run(self, user_prompt: str, files: List = None, feedback: str = None, 
+    def _speculation_safe(self, prompt: str, files: List, feedback: str,
+                          constraints: Dict) -> bool:
+        """
+        Whether code generation may run speculatively from the raw prompt.
+
+        Iterative requests (feedback/previous code), constraint overrides and
+        reference files all change what the code generator should see, so
+        those go through the serial spec-then-code flow. Otherwise speculate
+        only when the prompt already names a known part type - the example
+        set injected speculatively is then likely to match the spec-driven
+        one, which is the acceptance test in run().
+        """
+        if feedback or constraints or files:
+            return False
+        return bool(self._matched_example_files(prompt))
+
+    async def run(self, user_prompt: str, files: List = None, feedback: str = None,
                   constraints: Dict = None) -> Dict[str, Any]:
         """
         2-stage pipeline: Spec → Code (skip planning for speed)
@@ -329,31 +566,66 @@ class AgentPipeline:
         (dimensions, features, constraints), second stage generates code with that context.
         This separation reduces hallucination compared to single-stage generation.
         """
+        # Instances are cached per key in main.py; restore our credentials
+        # in case another key's pipeline configured the SDK since
+        _ensure_configured(self._api_key)
+
         timings = {}
 
         # Stage 1: Extract structured spec from natural language. LLM parses prompt into
         # JSON with dimensions, features, and constraints. This structured representation
         # provides clear context for code generation, reducing ambiguity.
+        #
+        # For non-iterative requests the two stages can overlap: the code
+        # generator works from the raw prompt speculatively while the spec is
+        # extracted, and the speculation is kept only if the spec would have
+        # selected the same example set. Both stages are LLM-latency bound,
+        # so an accepted speculation costs max() of the two calls, not sum.
         t0 = time.time()
-        spec, usage1 = await self._extract_spec(user_prompt, files)
+        spec_task = asyncio.ensure_future(self._extract_spec(user_prompt, files))
+        code_task = None
+        if self._speculation_safe(user_prompt, files, feedback, constraints):
+            code_task = asyncio.ensure_future(
+                self._generate_code(user_prompt, feedback=None))
+
+        spec_dict, usage1 = await spec_task
         timings["spec"] = time.time() - t0
 
-        # Apply constraint overrides
+        # Apply constraint overrides straight on the parsed dict
         if constraints:
-            try:
-                spec_data = json.loads(spec)
-                spec_data["constraints"] = {**spec_data.get("constraints", {}), **constraints}
-                spec = json.dumps(spec_data, indent=2)
-            except:
-                pass
+            spec_dict["constraints"] = {**spec_dict.get("constraints", {}), **constraints}
+
+        # Serialize once at the boundary; everything downstream shares it.
+        # Compact form: the only consumer is the codegen model, and fewer
+        # bytes means fewer input tokens per request.
+        spec = json.dumps(spec_dict, separators=(",", ":"))
 
         # Stage 2: Generate FreeCAD Python code from structured spec. Dynamically injects
         # relevant few-shot examples based on part type (enclosure, bracket, gear) to improve
         # code quality without requiring model fine-tuning. Includes error feedback from
         # previous attempts for self-correction.
-        t1 = time.time()
-        code, usage2 = await self._generate_code(spec, feedback=feedback)
-        timings["code"] = time.time() - t1
+        code = None
+        if code_task is not None:
+            if self._matched_example_files(spec) == self._matched_example_files(user_prompt):
+                try:
+                    code, usage2 = await code_task
+                    timings["code"] = time.time() - t0
+                except Exception as e:
+                    logger.warning(f"Speculative code-gen failed, rerunning from spec: {e}")
+            else:
+                # Spec revealed a different template set than the prompt
+                # suggested - throw the speculation away and rerun from spec
+                logger.info("Speculative code-gen discarded: example set changed")
+                code_task.cancel()
+                try:
+                    await code_task
+                except (asyncio.CancelledError, Exception):
+                    pass
+
+        if code is None:
+            t1 = time.time()
+            code, usage2 = await self._generate_code(spec, feedback=feedback)
+            timings["code"] = time.time() - t1
         timings["plan"] = 0  # No planning stage
 
         return {
@@ -363,38 +635,17 @@ class AgentPipeline:
             "timings": timings,
             "usage": {
                 "input_tokens": usage1['input'] + usage2['input'],
-                "output_tokens": usage1['output'] + usage2['output']
+                "output_tokens": usage1['output'] + usage2['output'],
+                "cached_input_tokens": usage1.get('cached', 0) + usage2.get('cached', 0)
             }
         }
 
-    async def _extract_spec(self, prompt: str, files: List = None) -> tuple[str, dict]:
-        """Extract specification from prompt. Robust error handling to prevent 500 errors."""
-        system = """You are a CAD Specification Extractor. Output JSON ONLY.
-
-Required fields:
-{
-  "type": "enclosure|bracket|flange|gear|shaft|housing|custom",
-  "dimensions": { ... all measurements in mm ... },
-  "features": [ { "type": "...", "params": {...} }, ... ],
-  "constraints": { "param_name": numeric_value, ... },
-  "coordinate_system": "corner|center"  // Are positions from corner (0,0) or center?
-}
-
-CRITICAL EXTRACTIONS:
-- For enclosures: wall_thickness vs floor_thickness (may differ!)
-- For brackets: leg lengths, hole positions, fillet radii
-- For flanges: bolt circle diameter, bolt count, bore size
-- For gears: module, tooth count, bore, hub dimensions
-- Position references: note if dimensions are from corner or center origin
-- AMBIGUOUS POSITIONS: If a position is described as "adjacent" or "next to" without coordinates,
-  calculate absolute positions based on object dimensions. Never leave positions undefined.
-
-Focus on GEOMETRY only. Ignore materials, colors, finishes."""
-
+    async def _extract_spec(self, prompt: str, files: List = None) -> tuple[dict, dict]:
+        """Extract specification from prompt as a parsed dict.
 
+        Robust error handling to prevent 500 errors; run() serializes the
+        dict once for everything downstream."""
         try:
-            model = genai.GenerativeModel(self.model.model_name, system_instruction=system)
-
             parts = [prompt]
             if files:
                 for f in files:
@@ -411,120 +662,75 @@ Focus on GEOMETRY only. Ignore materials, colors, finishes."""
                         logger.warning(f"Could not process file: {file_err}")
                         continue
 
-            response = await model.generate_content_async(parts)
-            text = response.text
+            response = await self._spec_model.generate_content_async(parts)
 
-            # Extract JSON from markdown if needed
-            if "```json" in text:
-                text = text.split("```json")[1].split("```")[0]
-            elif "```" in text:
-                text = text.split("```")[1].split("```")[0]
+            # JSON mode guarantees a parseable response; a decode error here
+            # falls through to the outer handler's minimal spec
+            parsed = json.loads(response.text)
 
-            # Validate JSON is parseable
-            try:
-                parsed = json.loads(text)
-                # FIX TEST 12: Resolve any ambiguous positions
-                if "features" in parsed:
-                    for feature in parsed.get("features", []):
-                        pos = feature.get("position", "")
-                        if isinstance(pos, str) and any(word in pos.lower() for word in ["adjacent", "next to", "beside", "near"]):
-                            logger.warning(f"Ambiguous position found: {pos}, setting to origin")
-                            feature["position"] = {"x": 0, "y": 0, "z": 0}
-                text = json.dumps(parsed, indent=2)
-            except json.JSONDecodeError as je:
-                logger.error(f"Failed to parse spec JSON: {je}")
-                # Return minimal valid spec rather than failing
-                text = json.dumps({
-                    "type": "custom",
-                    "dimensions": {},
-                    "features": [],
-                    "error": f"Could not parse prompt: {str(je)[:100]}"
-                })
-
-            return text.strip(), {
-                "input": response.usage_metadata.prompt_token_count,
-                "output": response.usage_metadata.candidates_token_count
+            # FIX TEST 12: Resolve any ambiguous positions
+            if "features" in parsed:
+                for feature in parsed.get("features", []):
+                    pos = feature.get("position", "")
+                    if isinstance(pos, str) and _AMBIG_RE.search(pos):
+                        logger.warning(f"Ambiguous position found: {pos}, setting to origin")
+                        feature["position"] = {"x": 0, "y": 0, "z": 0}
+
+            usage_meta = response.usage_metadata
+            return parsed, {
+                "input": usage_meta.prompt_token_count,
+                "output": usage_meta.candidates_token_count
             }
         except Exception as e:
             # FIX TEST 12: Never raise 500 - return error spec instead
             logger.error(f"Spec extraction failed: {e}")
-            return json.dumps({
+            return {
                 "type": "custom",
                 "dimensions": {},
                 "features": [],
                 "error": f"Spec extraction failed: {str(e)[:200]}"
-            }), {"input": 0, "output": 0}
+            }, {"input": 0, "output": 0}
 
 
     async def _generate_code(self, spec: str, feedback: str = None) -> tuple[str, dict]:
-        # Get type-specific examples based on spec content
+        # Get type-specific examples based on spec content. These vary per
+        # request, so they ride in the user message — the static quick ref
+        # and few-shot examples live in CODEGEN_SYSTEM_PROMPT (cacheable).
         relevant_examples = self._get_relevant_examples(spec)
-        
-        system = f"""You are an Expert FreeCAD Code Generator.
-
-{UTILS_QUICK_REF}
-
-{FEW_SHOT_EXAMPLES}
-{relevant_examples}
-
-OUTPUT FORMAT:
-```python
-def generate_model(utils, step_path, stl_path):
-    from FreeCAD import Base
-    
-    # Your code here
-    
-    utils.export_step(body, step_path)
-    utils.export_stl(body, stl_path)
-```
-
-CRITICAL RULES:
-
-1. USE MEGA-FUNCTIONS when available:
-   - Enclosures: `body, floor_z = utils.create_enclosure_base(...)`
-   - Brackets: `body = utils.create_l_bracket(...)`
-   - Flanges: `body = utils.create_pipe_flange(...)`
-   
-2. COORDINATE CONVERSION:
-   If spec positions are from corner (e.g., X=12.5 on 110mm part):
-   `centered_x = corner_x - length/2  # 12.5 - 55 = -42.5`
-
-3. DRAFT BEFORE FILLETS (mandatory for enclosures):
-   The mega-function handles this internally. Don't add extra draft calls.
-
-4. BOSS POSITIONS use centered coordinates:
-   `positions = [(-42.5, -27.5), (42.5, -27.5), (-42.5, 27.5), (42.5, 27.5)]`
-
-5. ALWAYS use position= parameter:
-   `utils.create_cylinder("hole", r, h, position=Base.Vector(x, y, z))`
-
-6. KEEP CODE SHORT - mega-functions do the heavy lifting.
-   Typical enclosure: 15-20 lines
-   Typical bracket: 5-10 lines
-   Typical flange: 5-10 lines
-
-7. END WITH EXPORTS:
-   ```python
-   utils.export_step(body, step_path)
-   utils.export_stl(body, stl_path)
-   ```
-"""
 
         user_msg = f"Generate FreeCAD code for this specification:\n\n{spec}"
+        if relevant_examples:
+            user_msg = f"{relevant_examples}\n\n{user_msg}"
         if feedback:
             user_msg += f"\n\n⚠️ PREVIOUS ATTEMPT FAILED:\n{feedback}\n\nFix the issue!"
 
-        chat = self.model.start_chat(history=[])
-        response = await chat.send_message_async([system, user_msg])
+        cached_model = self._get_cached_codegen_model()
+        response = None
+        if cached_model is not None:
+            try:
+                chat = cached_model.start_chat(history=[])
+                response = await chat.send_message_async(user_msg)
+            except Exception as e:
+                # Server dropped the cache early (or rejected it at send
+                # time): invalidate and fall through to the inline prompt
+                logger.warning(f"Cached-prompt request failed, retrying inline: {e}")
+                self._codegen_model = None
+                self._cache_expiry = 0.0
+                response = None
+        if response is None:
+            chat = self.model.start_chat(history=[])
+            response = await chat.send_message_async([CODEGEN_SYSTEM_PROMPT, user_msg])
 
         text = response.text
         logger.info(f"Raw response (first 300): {text[:300]}")
 
-        # Extract code from markdown
-        if "```python" in text:
-            text = text.split("```python")[1].split("```")[0]
-        elif "```" in text:
-            text = text.split("```")[1].split("```")[0]
+        # Extract code from markdown: partition scans once and allocates no
+        # intermediate lists, and this runs on every LLM response
+        _, sep, rest = text.partition("```python")
+        if not sep:
+            _, sep, rest = text.partition("```")
+        if sep:
+            text = rest.partition("```")[0]
 
         # Ensure function definition exists
         if "def generate_model" not in text:
@@ -533,11 +739,9 @@ CRITICAL RULES:
 
         # Security validation: block dangerous patterns that could escape Docker sandbox.
         # Even with network isolation, preventing subprocess/system calls adds defense-in-depth.
-        # These patterns are blocked before code reaches the execution container.
-        dangerous = ["subprocess", "os.system", "eval(", "exec(", "__import__", "os.popen"]
-        for pattern in dangerous:
-            if pattern in text:
-                raise ValueError(f"Security: blocked pattern '{pattern}'")
+        m = _DANGER_RE.search(text)
+        if m:
+            raise ValueError(f"Security: blocked pattern '{m.group()}'")
 
         # Wrap in executable script
         final_code = f"""import os, sys
@@ -555,9 +759,11 @@ if __name__ == '__main__':
                    os.environ.get('STL_OUTPUT', 'output.stl'))
 """
 
+        usage_meta = response.usage_metadata
         return final_code, {
-            "input": response.usage_metadata.prompt_token_count,
-            "output": response.usage_metadata.candidates_token_count
+            "input": usage_meta.prompt_token_count,
+            "output": usage_meta.candidates_token_count,
+            "cached": getattr(usage_meta, "cached_content_token_count", 0) or 0
         }
 
     def validate_mesh(self, stl_path: str) -> Dict[str, Any]: